@@ -1,5 +1,6 @@
 import json
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, Literal
 
@@ -42,11 +43,35 @@ class IndexerDB:
         else:
             self.db_path = db_path
 
+        self._local = threading.local()
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        """
+        Return this thread's connection, creating and tuning it on first use.
+
+        Reusing the connection keeps sqlite3's per-connection prepared-
+        statement cache warm, so repeated tool queries skip the SQL re-parse
+        (and the connection-open cost) they previously paid on every call.
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
         conn.row_factory = sqlite3.Row
+        # Read-heavy workload tuning: WAL lets tool reads run alongside
+        # indexer writes (journal_mode persists in the DB file but is cheap
+        # to re-issue); the rest keeps hot B-tree pages in memory.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # INSERT OR REPLACE must fire the FTS delete trigger for the row it
+        # displaces, which only happens with recursive triggers enabled.
+        conn.execute("PRAGMA recursive_triggers=ON")
+        self._local.conn = conn
         return conn
 
     def _init_db(self) -> None:
@@ -58,6 +83,81 @@ class IndexerDB:
         with self._get_conn() as conn:
             with open(schema_path) as f:
                 conn.executescript(f.read())
+            # Each (from, to, relation) triple should exist once; the unique
+            # index enforces that and lets inserts dedup via OR IGNORE. An
+            # existing database indexed before this constraint may hold
+            # duplicates, so collapse them (keeping the oldest) and retry.
+            create_unique = (
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_edges_unique "
+                "ON edges(from_node_id, to_node_id, relation_type)"
+            )
+            try:
+                conn.execute(create_unique)
+            except sqlite3.IntegrityError:
+                conn.execute(
+                    """
+                    DELETE FROM edges WHERE id NOT IN (
+                        SELECT MIN(id) FROM edges
+                        GROUP BY from_node_id, to_node_id, relation_type
+                    )
+                    """
+                )
+                conn.execute(create_unique)
+            # Older DBs predate the stat fast-path columns; the guard makes
+            # the ALTER idempotent.
+            for column in ("mtime_ns INTEGER", "size INTEGER"):
+                try:
+                    conn.execute(f"ALTER TABLE file_metadata ADD COLUMN {column}")
+                except sqlite3.OperationalError:
+                    pass
+            # Populate sqlite_stat1 so the planner picks the composite indexes
+            conn.execute("ANALYZE")
+            self.has_fts = self._ensure_fts(conn)
+
+    def _ensure_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the signature full-text index and its sync triggers.
+
+        Kept out of schema.sql because FTS5 is a compile-time SQLite option;
+        returns False (and search falls back to LIKE) when unavailable. The
+        external-content table stores only the token index, reading signature
+        text back from nodes by rowid.
+        """
+        try:
+            exists = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'nodes_sig_fts'"
+                ).fetchone()
+                is not None
+            )
+            if not exists:
+                conn.executescript(
+                    """
+                    CREATE VIRTUAL TABLE nodes_sig_fts USING fts5(
+                        signature, content='nodes', content_rowid='rowid'
+                    );
+                    CREATE TRIGGER nodes_sig_fts_ai AFTER INSERT ON nodes BEGIN
+                        INSERT INTO nodes_sig_fts(rowid, signature)
+                        VALUES (new.rowid, new.signature);
+                    END;
+                    CREATE TRIGGER nodes_sig_fts_ad AFTER DELETE ON nodes BEGIN
+                        INSERT INTO nodes_sig_fts(nodes_sig_fts, rowid, signature)
+                        VALUES ('delete', old.rowid, old.signature);
+                    END;
+                    CREATE TRIGGER nodes_sig_fts_au AFTER UPDATE ON nodes BEGIN
+                        INSERT INTO nodes_sig_fts(nodes_sig_fts, rowid, signature)
+                        VALUES ('delete', old.rowid, old.signature);
+                        INSERT INTO nodes_sig_fts(rowid, signature)
+                        VALUES (new.rowid, new.signature);
+                    END;
+                    """
+                )
+                # Index whatever nodes an existing database already holds
+                conn.execute("INSERT INTO nodes_sig_fts(nodes_sig_fts) VALUES ('rebuild')")
+                conn.commit()
+            return True
+        except sqlite3.OperationalError:
+            return False
 
     def upsert_node(self, node: Node) -> None:
         """Insert or replace a node."""
@@ -85,17 +185,58 @@ class IndexerDB:
             conn.commit()
 
     def upsert_edge(self, edge: Edge) -> None:
-        """Insert an edge."""
+        """Insert an edge (duplicates are dropped by the unique triple index)."""
         with self._get_conn() as conn:
             conn.execute(
                 """
-                INSERT INTO edges (from_node_id, to_node_id, relation_type)
+                INSERT OR IGNORE INTO edges (from_node_id, to_node_id, relation_type)
                 VALUES (?, ?, ?)
                 """,
                 (edge.from_node_id, edge.to_node_id, edge.relation_type),
             )
             conn.commit()
 
+    def bulk_upsert(self, nodes: list[Node], edges: list[Edge]) -> None:
+        """
+        Insert a batch of nodes and edges in a single transaction.
+
+        One commit per file (or per batch) instead of one per row: each
+        commit is an fsync under WAL, so per-row upserts dominate large
+        reindex runs.
+        """
+        with self._get_conn() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO nodes (
+                    id, name, kind, file_path, start_line, end_line, signature, docstring,
+                    decorators, visibility
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        node.id,
+                        node.name,
+                        node.kind,
+                        node.file_path,
+                        node.start_line,
+                        node.end_line,
+                        node.signature,
+                        node.docstring,
+                        json.dumps(node.decorators) if node.decorators else None,
+                        node.visibility,
+                    )
+                    for node in nodes
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO edges (from_node_id, to_node_id, relation_type)
+                VALUES (?, ?, ?)
+                """,
+                [(edge.from_node_id, edge.to_node_id, edge.relation_type) for edge in edges],
+            )
+            conn.commit()
+
     def clear_file(self, file_path: str) -> None:
         """Remove all nodes and edges associated with a file."""
         # Note: We need to be careful with edges.
@@ -121,6 +262,43 @@ class IndexerDB:
 
             # Delete the nodes themselves
             conn.execute("DELETE FROM nodes WHERE file_path = ?", (file_path,))
+            conn.execute("DELETE FROM file_metadata WHERE file_path = ?", (file_path,))
+            conn.commit()
+
+    def get_file_metadata(self, file_path: str) -> tuple[str | None, int | None, int | None] | None:
+        """Return (content_hash, mtime_ns, size) for a file, or None if never indexed."""
+        with self._get_conn() as conn:
+            cursor = conn.execute(
+                "SELECT content_hash, mtime_ns, size FROM file_metadata WHERE file_path = ?",
+                (file_path,),
+            )
+            row = cursor.fetchone()
+            return (row[0], row[1], row[2]) if row else None
+
+    def get_all_file_metadata(self) -> dict[str, tuple[str | None, int | None, int | None]]:
+        """Return every file's (content_hash, mtime_ns, size) in one query."""
+        with self._get_conn() as conn:
+            cursor = conn.execute(
+                "SELECT file_path, content_hash, mtime_ns, size FROM file_metadata"
+            )
+            return {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
+
+    def set_content_hash(
+        self,
+        file_path: str,
+        content_hash: str,
+        mtime_ns: int | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Record the content hash (and stat fingerprint) of a freshly indexed file."""
+        with self._get_conn() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO file_metadata (file_path, content_hash, mtime_ns, size)
+                VALUES (?, ?, ?, ?)
+                """,
+                (file_path, content_hash, mtime_ns, size),
+            )
             conn.commit()
 
     def get_node(self, node_id: str) -> dict[str, Any] | None:
@@ -1,13 +1,23 @@
+import hashlib
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import pathspec
 
-from vibegraph.indexer.db import IndexerDB
+from vibegraph.indexer.db import Edge, IndexerDB, Node
 from vibegraph.indexer.parser import ParserFactory
 from vibegraph.indexer.resolver import ModuleResolver
 
+# Below this many files the pool startup cost outweighs the parallel parse;
+# small trees (and the test fixtures) stay on the serial path.
+_PARALLEL_MIN_FILES = 8
+
+# Per-worker-process resolver, keyed by project root. Building the module map
+# walks the tree, so each worker does it once rather than once per file.
+_worker_resolvers: dict[str, ModuleResolver] = {}
+
 
 def index_file(
     db: IndexerDB,
@@ -38,23 +48,38 @@ def index_file(
                 print(f"Skipping {file_path} (unsupported language)")
             return
 
-        # Read using abs_path but index using rel_path
-        with open(abs_path, "rb") as f:
-            source_code = f.read()
+        # Multi-level change detection: a stat match skips the read entirely,
+        # a hash match skips the parse (editors often rewrite files unchanged).
+        stat = abs_path.stat()
+        known = db.get_file_metadata(rel_path)
+        if known and known[1] == stat.st_mtime_ns and known[2] == stat.st_size:
+            if verbose:
+                print(f"Skipping {rel_path} (stat unchanged)")
+            return
+
+        # Read using abs_path but index using rel_path. read_bytes issues a
+        # single full-size read without the buffered-IO layer.
+        source_code = abs_path.read_bytes()
+
+        content_hash = hashlib.blake2b(source_code, digest_size=16).hexdigest()
+        if known and content_hash == known[0]:
+            # Touched but byte-identical: refresh the stat fingerprint so the
+            # next pass skips on stat alone.
+            db.set_content_hash(rel_path, content_hash, stat.st_mtime_ns, stat.st_size)
+            if verbose:
+                print(f"Skipping {rel_path} (content unchanged)")
+            return
 
         if verbose:
             print(f"Indexing {rel_path}...")
         nodes, edges = parser.extract(rel_path, source_code)
 
-        # Clear old data for this file
+        # Clear old data for this file, then write the batch in one
+        # transaction instead of one commit (fsync) per row.
         db.clear_file(rel_path)
+        db.bulk_upsert(nodes, edges)
 
-        # Insert new data
-        for node in nodes:
-            db.upsert_node(node)
-
-        for edge in edges:
-            db.upsert_edge(edge)
+        db.set_content_hash(rel_path, content_hash, stat.st_mtime_ns, stat.st_size)
 
         if verbose:
             print(f"  -> Extracted {len(nodes)} nodes, {len(edges)} edges.")
@@ -64,6 +89,47 @@ def index_file(
             print(f"Error indexing {file_path}: {e}")
 
 
+def _parse_file_task(
+    abs_path: str,
+    rel_path: str,
+    known: tuple[str | None, int | None, int | None] | None,
+    root: str,
+) -> tuple[str, str, int, int, list[Node] | None, list[Edge] | None] | tuple[str, str] | None:
+    """
+    Parse one file in a worker process.
+
+    Returns (rel_path, content_hash, mtime_ns, size, nodes, edges) for the
+    parent to apply; nodes/edges are None when only the stat fingerprint
+    needs refreshing. Returns None when the file is unchanged or
+    unsupported, and a (rel_path, error) pair when reading or parsing
+    raised, so the parent can report it like the serial path does. All DB
+    writes stay in the parent — SQLite connections don't cross processes.
+    """
+    try:
+        resolver = _worker_resolvers.get(root)
+        if resolver is None:
+            resolver = _worker_resolvers[root] = ModuleResolver(Path(root))
+
+        parser = ParserFactory.get_parser(rel_path, resolver=resolver)
+        if not parser:
+            return None
+
+        stat = os.stat(abs_path)
+        if known and known[1] == stat.st_mtime_ns and known[2] == stat.st_size:
+            return None
+
+        source_code = Path(abs_path).read_bytes()
+        content_hash = hashlib.blake2b(source_code, digest_size=16).hexdigest()
+        if known and content_hash == known[0]:
+            # Touched but byte-identical: indexed data is current.
+            return (rel_path, content_hash, stat.st_mtime_ns, stat.st_size, None, None)
+
+        nodes, edges = parser.extract(rel_path, source_code)
+        return (rel_path, content_hash, stat.st_mtime_ns, stat.st_size, nodes, edges)
+    except Exception as e:
+        return (rel_path, str(e))
+
+
 def load_gitignore(root_path: Path) -> pathspec.PathSpec | None:
     """Load .gitignore from the root path if it exists."""
     gitignore_path = root_path / ".gitignore"
@@ -103,6 +169,7 @@ def reindex_all(db: IndexerDB, target_path_str: str, verbose: bool = True):
         # but often it's external, so resolver remains None
         index_file(db, str(target_path), project_root=target_path.parent, verbose=verbose)
     elif target_path.is_dir():
+        candidates: list[Path] = []
         for root, dirs, files in os.walk(target_path):
             current_root = Path(root)
 
@@ -122,6 +189,10 @@ def reindex_all(db: IndexerDB, target_path_str: str, verbose: bool = True):
                     except ValueError:
                         pass
 
+                candidates.append(full_path)
+
+        if len(candidates) < _PARALLEL_MIN_FILES:
+            for full_path in candidates:
                 index_file(
                     db,
                     str(full_path),
@@ -129,11 +200,56 @@ def reindex_all(db: IndexerDB, target_path_str: str, verbose: bool = True):
                     resolver=resolver,
                     verbose=verbose,
                 )
+        else:
+            _reindex_parallel(db, target_path, candidates, verbose=verbose)
     else:
         if verbose:
             print(f"Path not found: {target_path}")
 
 
+def _reindex_parallel(
+    db: IndexerDB, target_path: Path, candidates: list[Path], verbose: bool = True
+):
+    """
+    Fan per-file parsing out to a process pool.
+
+    tree-sitter parsing is CPU-bound and the GIL blocks thread-level
+    parallelism, so workers do read + hash + parse while the parent applies
+    results to the single DB connection as they complete.
+    """
+    known_metadata = db.get_all_file_metadata()
+    root = str(target_path)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = []
+        for full_path in candidates:
+            rel_path = str(full_path.relative_to(target_path)).replace("\\", "/")
+            futures.append(
+                pool.submit(
+                    _parse_file_task, str(full_path), rel_path, known_metadata.get(rel_path), root
+                )
+            )
+
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                continue
+            if len(result) == 2:
+                rel_path, error = result
+                if verbose:
+                    print(f"Error indexing {rel_path}: {error}")
+                continue
+            rel_path, content_hash, mtime_ns, size, nodes, edges = result
+            if nodes is None or edges is None:
+                db.set_content_hash(rel_path, content_hash, mtime_ns, size)
+                continue
+            db.clear_file(rel_path)
+            db.bulk_upsert(nodes, edges)
+            db.set_content_hash(rel_path, content_hash, mtime_ns, size)
+            if verbose:
+                print(f"Indexed {rel_path}: {len(nodes)} nodes, {len(edges)} edges.")
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python -m vibegraph.indexer.main <directory_or_file>")
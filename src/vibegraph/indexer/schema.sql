@@ -22,6 +22,23 @@ CREATE TABLE IF NOT EXISTS edges (
     FOREIGN KEY(to_node_id) REFERENCES nodes(id)
 );
 
+-- Per-file bookkeeping used to skip re-indexing unchanged content.
+-- mtime_ns/size give a stat-only fast path; content_hash catches files that
+-- were touched but not actually changed.
+CREATE TABLE IF NOT EXISTS file_metadata (
+    file_path TEXT PRIMARY KEY,
+    content_hash TEXT,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+
 CREATE INDEX IF NOT EXISTS idx_nodes_file_path ON nodes(file_path);
-CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_node_id);
-CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_node_id);
+-- Name lookups anchor call-stack walks and find_references
+CREATE INDEX IF NOT EXISTS idx_nodes_name ON nodes(name);
+-- Keyset pagination for structural summaries: (file_path, start_line, id)
+CREATE INDEX IF NOT EXISTS idx_nodes_file_line ON nodes(file_path, start_line, id);
+-- Covering composite indexes: traversal queries filter one endpoint (often
+-- with a relation_type list) and read the other, so both lookups are
+-- answered entirely from the index.
+CREATE INDEX IF NOT EXISTS idx_edges_rev ON edges(to_node_id, relation_type, from_node_id);
+CREATE INDEX IF NOT EXISTS idx_edges_fwd ON edges(from_node_id, relation_type, to_node_id);
@@ -1,3 +1,5 @@
+import os
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -9,12 +11,26 @@ from watchdog.observers import Observer
 from vibegraph.indexer.db import IndexerDB
 from vibegraph.indexer.main import index_file
 
+# Standard strict ignores, checked on every filesystem event.
+_IGNORE_SET = frozenset(
+    {
+        ".git",
+        ".venv",
+        "node_modules",
+        "__pycache__",
+        ".ruff_cache",
+        "dist",
+        "build",
+        "vibegraph_context",
+    }
+)
+
 
 class CodeChangeHandler(FileSystemEventHandler):
     def __init__(
         self,
         db: IndexerDB,
-        on_change: Callable[[], None] | None = None,
+        on_change: Callable[[str], None] | None = None,
         root_path: str = ".",
     ):
         self.db = db
@@ -38,18 +54,8 @@ class CodeChangeHandler(FileSystemEventHandler):
         """Check if file should be ignored based on gitignore and common patterns."""
         path = Path(file_path).resolve()
 
-        # Standard strict ignores
-        ignore_patterns = [
-            ".git",
-            ".venv",
-            "node_modules",
-            "__pycache__",
-            ".ruff_cache",
-            "dist",
-            "build",
-            "vibegraph_context",
-        ]
-        if any(p in path.parts for p in ignore_patterns):
+        # frozenset intersection runs in C, vs a per-event generator scan
+        if not _IGNORE_SET.isdisjoint(path.parts):
             return True
 
         if self.gitignore_spec:
@@ -62,10 +68,20 @@ class CodeChangeHandler(FileSystemEventHandler):
 
         return False
 
-    def _notify(self):
+    def _notify(self, file_path: str):
+        """Invoke the callback with the changed path, relative to the root.
+
+        Subscribers (e.g. the web API's delta broadcast) key off the same
+        root-relative form the indexer stores in node rows.
+        """
         if self.on_change:
             try:
-                self.on_change()
+                path = Path(file_path).resolve()
+                try:
+                    rel = str(path.relative_to(self.root_path)).replace("\\", "/")
+                except ValueError:
+                    rel = str(path).replace("\\", "/")
+                self.on_change(rel)
             except Exception as e:
                 print(f"Error in watcher callback: {e}")
 
@@ -74,30 +90,116 @@ class CodeChangeHandler(FileSystemEventHandler):
             return
         print(f"File modified: {event.src_path}")
         index_file(self.db, event.src_path)
-        self._notify()
+        self._notify(event.src_path)
 
     def on_created(self, event):
         if event.is_directory or self._should_ignore(event.src_path):
             return
         print(f"File created: {event.src_path}")
         index_file(self.db, event.src_path)
-        self._notify()
+        self._notify(event.src_path)
 
     def on_deleted(self, event):
         if event.is_directory or self._should_ignore(event.src_path):
             return
         print(f"File deleted: {event.src_path}")
         self.db.clear_file(event.src_path)
-        self._notify()
-
-
-def start_observer(path: str, db: IndexerDB, callback: Callable[[], None] | None = None) -> Any:
+        self._notify(event.src_path)
+
+
+class _FsEvent:
+    """Minimal stand-in for a watchdog event, fed to CodeChangeHandler."""
+
+    __slots__ = ("is_directory", "src_path")
+
+    def __init__(self, src_path: str, is_directory: bool):
+        self.src_path = src_path
+        self.is_directory = is_directory
+
+
+class InotifyRecursiveObserver(threading.Thread):
+    """
+    Recursive watcher backed by a single inotify instance (Linux only).
+
+    watchdog allocates one inotify instance per observer, and large sessions
+    can run into fs.inotify.max_user_instances. This observer registers every
+    directory on one shared fd with a minimal event mask (create/modify/
+    delete/move) and adds watches for directories created after startup.
+
+    Requires the optional inotify_simple package; start_observer falls back
+    to watchdog when it is unavailable.
+    """
+
+    def __init__(self, root: Path, handler: CodeChangeHandler):
+        super().__init__(daemon=True)
+        from inotify_simple import INotify, flags
+
+        self._flags = flags
+        self._inotify = INotify()
+        self._mask = flags.CREATE | flags.MODIFY | flags.DELETE | flags.MOVED_TO | flags.MOVED_FROM
+        self._handler = handler
+        self._wd_paths: dict[int, str] = {}
+        self._stopped = threading.Event()
+        self._watch_tree(str(root))
+
+    def _watch_tree(self, root: str):
+        for dirpath, dirnames, _files in os.walk(root):
+            dirnames[:] = [
+                d for d in dirnames if not self._handler._should_ignore(os.path.join(dirpath, d))
+            ]
+            self._add_watch(dirpath)
+
+    def _add_watch(self, path: str):
+        try:
+            wd = self._inotify.add_watch(path, self._mask)
+            self._wd_paths[wd] = path
+        except OSError:
+            pass  # Directory vanished between listing and watching
+
+    def run(self):
+        flags = self._flags
+        while not self._stopped.is_set():
+            for event in self._inotify.read(timeout=500):
+                base = self._wd_paths.get(event.wd)
+                if base is None:
+                    continue
+                full = os.path.join(base, event.name) if event.name else base
+                is_dir = bool(event.mask & flags.ISDIR)
+                if event.mask & (flags.CREATE | flags.MOVED_TO):
+                    if is_dir:
+                        # New directory: watch it (and anything created inside
+                        # before the watch was registered).
+                        self._watch_tree(full)
+                        continue
+                    self._handler.on_created(_FsEvent(full, is_dir))
+                elif event.mask & flags.MODIFY:
+                    self._handler.on_modified(_FsEvent(full, is_dir))
+                elif event.mask & (flags.DELETE | flags.MOVED_FROM):
+                    self._handler.on_deleted(_FsEvent(full, is_dir))
+        self._inotify.close()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def start_observer(path: str, db: IndexerDB, callback: Callable[[str], None] | None = None) -> Any:
     """Start the observer and return it (non-blocking)."""
     path_obj = Path(path).resolve()
     if not path_obj.exists():
         print(f"Warning: Path not found: {path}")
 
     event_handler = CodeChangeHandler(db, callback, root_path=str(path_obj))
+
+    # Opt-in single-fd inotify backend (see InotifyRecursiveObserver).
+    if os.environ.get("VIBEGRAPH_NATIVE_INOTIFY") == "1" and os.name == "posix":
+        try:
+            native = InotifyRecursiveObserver(path_obj, event_handler)
+            native.start()
+            print(f"VibeGraph Watcher (native inotify) started on {path_obj}")
+            return native
+        except ImportError:
+            print("Warning: inotify_simple not installed, falling back to watchdog")
+
     observer = Observer()
     observer.schedule(event_handler, str(path_obj), recursive=True)
     observer.start()
@@ -5,10 +5,17 @@ This server provides tools to analyze and understand codebases through
 structural parsing (Tree-sitter) and a relational database (SQLite).
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import io
+import itertools
 import json
 import os
+import re
+import sqlite3
 import sys
-from contextlib import redirect_stdout
+import uuid
 from enum import Enum
 from pathlib import Path
 from typing import Literal
@@ -28,65 +35,131 @@ mcp = FastMCP("vibegraph_mcp")
 # =============================================================================
 
 
+# DB handles keyed by database path so each project root gets a single
+# IndexerDB (and SQLite connection) shared across tool calls.
+_db_pool: dict[str, IndexerDB] = {}
+
+
+# Path.resolve does a realpath walk (one stat per component); tool calls
+# resolve the same few raw strings over and over, so memoize by raw string.
+_RESOLVED_CACHE: dict[str, Path] = {}
+
+
+def _resolve_cached(p: str) -> Path:
+    path = _RESOLVED_CACHE.get(p)
+    if path is None:
+        path = _RESOLVED_CACHE[p] = Path(p).resolve()
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_project_root(search_dir: Path) -> Path:
+    """
+    Walk up from search_dir to the nearest marker directory.
+
+    Pure resolution half of context lookup: the marker walk stats every
+    ancestor, and many distinct path hints collapse to the same directory,
+    so caching by directory shares the result between them.
+    """
+    for parent in [search_dir, *search_dir.parents]:
+        if (
+            (parent / ".git").exists()
+            or (parent / "pyproject.toml").exists()
+            or (parent / "vibegraph_context").exists()
+        ):
+            return parent
+    return search_dir
+
+
+@functools.lru_cache(maxsize=32)
 def _get_context_for_path(path_hint: str | None = None) -> tuple[IndexerDB, Path]:
     """
     Determine the project root and database connection for a given path.
 
     It searches upwards from the path_hint (or CWD if None) for markers:
     .git, pyproject.toml, or vibegraph_context.
+
+    The lookup is cached per path_hint: the project root is stable for a
+    session, so repeated tool calls skip the marker walk and reuse the
+    pooled IndexerDB. Call _invalidate_context_cache() after a reindex.
     """
     if not path_hint or path_hint == ".":
         search_start = Path.cwd()
     else:
-        search_start = Path(path_hint).resolve()
+        search_start = _resolve_cached(path_hint)
 
     search_dir = search_start if search_start.is_dir() else search_start.parent
-    project_root = search_dir
-
-    # Traverse up for markers
-    for parent in [search_dir, *list(search_dir.parents)]:
-        if (
-            (parent / ".git").exists()
-            or (parent / "pyproject.toml").exists()
-            or (parent / "vibegraph_context").exists()
-        ):
-            project_root = parent
-            break
+    project_root = _resolve_project_root(search_dir)
 
     context_dir = project_root / "vibegraph_context"
     context_dir.mkdir(exist_ok=True)
-    db_path = context_dir / "vibegraph.db"
+    db_path = str(context_dir / "vibegraph.db")
 
-    return IndexerDB(db_path=str(db_path)), project_root
+    db = _db_pool.get(db_path)
+    if db is None:
+        db = _db_pool[db_path] = IndexerDB(db_path=db_path)
+    return db, project_root
 
 
+def _invalidate_context_cache() -> None:
+    """Drop cached root lookups and pooled DB handles (e.g. after a reindex)."""
+    _get_context_for_path.cache_clear()
+    _resolve_project_root.cache_clear()
+    _normalize_path.cache_clear()
+    _RESOLVED_CACHE.clear()
+    _db_pool.clear()
+
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_path(file_path: str, project_root: Path) -> str:
-    """Normalize file path relative to the identified project root."""
+    """Normalize file path relative to the identified project root.
+
+    Memoized: tools repeatedly normalize the same few paths per session,
+    and the result only changes when the tree does (cache cleared with the
+    context caches on reindex).
+    """
+    # os.path.abspath/relpath are pure string manipulation (no per-component
+    # stat calls like Path.resolve), which matters when normalizing in bulk.
+    abs_file = os.path.abspath(file_path)
+    abs_root = os.path.abspath(str(project_root))
     try:
-        # Use .resolve() consistently and switch to forward slashes for DB storage
-        abs_file = Path(file_path).resolve()
-        abs_root = project_root.resolve()
-        return str(abs_file.relative_to(abs_root)).replace("\\", "/")
-    except (ValueError, RuntimeError):
+        rel = os.path.relpath(abs_file, abs_root)
+    except ValueError:
+        # e.g. different drives on Windows
+        return abs_file.replace("\\", "/")
+    if rel.startswith(".."):
         # Fallback if path is not in project root
-        return str(Path(file_path).resolve()).replace("\\", "/")
+        return abs_file.replace("\\", "/")
+    return rel.replace(os.sep, "/")
 
 
-def _safe_str(s: str) -> str:
-    """Safely format string for output, replacing emojis on Windows if needed."""
-    if os.name != "nt":
-        return s
-
-    # Simple replacement map for common emojis used in this file
-    replacements = {
+# Replacement table for common emojis used in this file, precomputed so
+# _safe_str does a single C-level translate pass instead of one replace per key.
+_EMOJI_TABLE = str.maketrans(
+    {
         "🔄": "[CYCLE]",
         "←": "<-",
         "→": "->",
         "✅": "[OK]",
     }
-    for char, replacement in replacements.items():
-        s = s.replace(char, replacement)
-    return s
+)
+
+
+def _safe_str_windows(s: str) -> str:
+    """Replace emojis that Windows consoles often can't render."""
+    if s.isascii():
+        return s
+    return s.translate(_EMOJI_TABLE)
+
+
+# Bind the platform check once at import: on POSIX every call is a plain
+# identity function instead of re-testing os.name per string.
+_safe_str = _safe_str_windows if os.name == "nt" else (lambda s: s)
+
+# Arrow markers used for traversal output and the "(no callers/callees)"
+# sentinel checks; computed once rather than per line scanned.
+_ARROW_UP = _safe_str("←")
+_ARROW_DOWN = _safe_str("→")
 
 
 def _handle_error(e: Exception, context: str = "") -> str:
@@ -122,10 +195,21 @@ class TraceDirection(str, Enum):
 # =============================================================================
 
 
-class StructuralSummaryInput(BaseModel):
-    """Input model for structural summary operations."""
+class ToolInput(BaseModel):
+    """Base for tool input models: shared config for every tool's params."""
+
+    # No validate_assignment: inputs are validated once at the MCP boundary
+    # and no tool mutates its params afterwards.
+    model_config = ConfigDict(str_strip_whitespace=True)
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
+    )
+
+
+class StructuralSummaryInput(ToolInput):
+    """Input model for structural summary operations."""
 
     file_path: str = Field(
         ...,
@@ -140,20 +224,26 @@ class StructuralSummaryInput(BaseModel):
     )
     offset: int = Field(
         default=0,
-        description="Number of nodes to skip for pagination",
+        description="Number of nodes to skip for pagination (legacy; prefer after_line/after_id)",
         ge=0,
     )
-    response_format: ResponseFormat = Field(
-        default=ResponseFormat.MARKDOWN,
-        description="Output format: 'markdown' for human-readable or 'json' for machine-readable",
+    after_line: int | None = Field(
+        default=None,
+        description=(
+            "Keyset cursor: return nodes after this start_line. "
+            "Scales better than offset for large files"
+        ),
+        ge=0,
+    )
+    after_id: str | None = Field(
+        default=None,
+        description="Keyset cursor tie-breaker: node id from the previous page's next_cursor",
     )
 
 
-class CallStackInput(BaseModel):
+class CallStackInput(ToolInput):
     """Input model for call stack tracing operations."""
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
     node_name: str = Field(
         ...,
         description="Name of the function or class to trace (e.g., 'parse_file', 'IndexerDB')",
@@ -173,13 +263,19 @@ class CallStackInput(BaseModel):
         ge=1,
         le=10,
     )
+    max_nodes: int = Field(
+        default=5000,
+        description=(
+            "Hard cap on traversal rows per direction; dense graphs stop "
+            "expanding once the cap is hit and the output notes the truncation"
+        ),
+        ge=1,
+    )
 
 
-class ImpactAnalysisInput(BaseModel):
+class ImpactAnalysisInput(ToolInput):
     """Input model for impact analysis operations."""
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
     file_path: str = Field(
         ...,
         description="Path to the file to analyze for impact (e.g., 'src/db.py')",
@@ -187,11 +283,9 @@ class ImpactAnalysisInput(BaseModel):
     )
 
 
-class ReindexInput(BaseModel):
+class ReindexInput(ToolInput):
     """Input model for reindexing operations."""
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
     path: str = Field(
         default=".",
         description=(
@@ -201,10 +295,18 @@ class ReindexInput(BaseModel):
     )
 
 
-class ReferencesInput(BaseModel):
-    """Input model for finding reference operations."""
+class ReindexStatusInput(ToolInput):
+    """Input model for reindex job status checks."""
+
+    job_id: str = Field(
+        ...,
+        description="Job id returned by vibegraph_reindex_project",
+        min_length=1,
+    )
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+
+class ReferencesInput(ToolInput):
+    """Input model for finding reference operations."""
 
     symbol_name: str = Field(
         ...,
@@ -217,11 +319,9 @@ class ReferencesInput(BaseModel):
     )
 
 
-class DependenciesInput(BaseModel):
+class DependenciesInput(ToolInput):
     """Input model for dependency analysis operations."""
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
     file_path: str = Field(
         ...,
         description="Path to the file to check for outgoing dependencies",
@@ -229,11 +329,9 @@ class DependenciesInput(BaseModel):
     )
 
 
-class SearchInput(BaseModel):
+class SearchInput(ToolInput):
     """Input model for signature search operations."""
 
-    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
-
     pattern: str = Field(
         ...,
         description=(
@@ -252,71 +350,326 @@ class SearchInput(BaseModel):
 # =============================================================================
 
 
+def _ensure_stdlib_table(conn) -> None:
+    """Create and fill the per-connection stdlib_modules temp table once."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS stdlib_modules(name TEXT PRIMARY KEY)")
+    if conn.execute("SELECT 1 FROM stdlib_modules LIMIT 1").fetchone() is None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO stdlib_modules VALUES (?)",
+            ((name,) for name in sys.stdlib_module_names),
+        )
+
+
+# Outgoing imports, pre-bucketed and pre-sorted by SQL: the CASE probes the
+# stdlib_modules temp table with the root package of the module name.
+_DEPS_QUERY = """
+    SELECT DISTINCT n_to.name, n_to.file_path, n_to.kind,
+        CASE
+            WHEN n_to.file_path != 'external' THEN 'internal'
+            WHEN EXISTS (
+                SELECT 1 FROM stdlib_modules
+                WHERE name = substr(n_to.name, 1, instr(n_to.name || '.', '.') - 1)
+            ) THEN 'stdlib'
+            ELSE 'third_party'
+        END AS bucket
+    FROM nodes n_from
+    JOIN edges e ON n_from.id = e.from_node_id
+    JOIN nodes n_to ON e.to_node_id = n_to.id
+    WHERE n_from.file_path = ? AND e.relation_type = 'imports'
+    ORDER BY bucket, n_to.name
+"""
+
+
+# Module-level SQL constants: sqlite3's statement cache is keyed by text
+# identity, so constants hit the prepared form on every call instead of
+# re-hashing strings rebuilt inside the handlers.
+_COUNT_NODES_QUERY = "SELECT COUNT(*) FROM nodes WHERE file_path = ?"
+
+_FILE_HAS_NODES_QUERY = "SELECT 1 FROM nodes WHERE file_path = ? LIMIT 1"
+
+_NODE_LOOKUP_QUERY = "SELECT id, name, file_path, kind FROM nodes WHERE name = ?"
+
+_NODE_LOOKUP_BY_FILE_QUERY = _NODE_LOOKUP_QUERY + " AND file_path = ?"
+
+# Keyset pagination: O(log N) per page regardless of position, vs OFFSET
+# which scans and discards offset rows.
+_SUMMARY_KEYSET_QUERY = """
+    SELECT id, name, kind, signature, start_line, end_line, decorators, visibility
+    FROM nodes
+    WHERE file_path = ? AND (start_line, id) > (?, ?)
+    ORDER BY start_line, id
+    LIMIT ?
+"""
+
+_SUMMARY_OFFSET_QUERY = """
+    SELECT id, name, kind, signature, start_line, end_line, decorators, visibility
+    FROM nodes
+    WHERE file_path = ?
+    ORDER BY start_line
+    LIMIT ? OFFSET ?
+"""
+
+
+# Token search over the signature FTS index. A leading-wildcard LIKE scans
+# every signature; the FTS MATCH resolves from the token index instead.
+_SIG_FTS_QUERY = """
+    SELECT n.name, n.signature, n.file_path, n.start_line
+    FROM nodes_sig_fts f
+    JOIN nodes n ON n.rowid = f.rowid
+    WHERE nodes_sig_fts MATCH ?
+    LIMIT 50
+"""
+
+_SIG_LIKE_QUERY = (
+    "SELECT name, signature, file_path, start_line FROM nodes WHERE signature LIKE ? LIMIT 50"
+)
+
+
+def _fts_phrase(pattern: str) -> str | None:
+    """
+    Convert a LIKE pattern into an FTS5 phrase query.
+
+    '%List[str]%' tokenizes to adjacent tokens List, str — the same split
+    unicode61 applies to the indexed signatures — so the quoted phrase
+    '"List str"' matches the original substring. Returns None when the
+    pattern holds no word characters (nothing for FTS to match on).
+    """
+    tokens = re.findall(r"\w+", pattern)
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"'
+
+
+# Targets and their referrers in one round trip: the LEFT JOINs keep targets
+# with no usages (referrer columns come back NULL), and ORDER BY t.id groups
+# rows per target for itertools.groupby.
+_REFERENCES_QUERY = """
+    SELECT t.id AS target_id, t.name AS target_name, t.file_path AS target_file,
+           n.name, n.file_path, n.start_line, e.relation_type
+    FROM nodes t
+    LEFT JOIN edges e
+        ON e.to_node_id = t.id AND e.relation_type IN ('calls', 'references')
+    LEFT JOIN nodes n ON n.id = e.from_node_id
+    WHERE t.name = ?
+    ORDER BY t.id, n.file_path, n.start_line
+"""
+
+
+# Transitive impact walk (up to 3 levels of reverse edges) in one query,
+# instead of a Python BFS issuing one SELECT per visited node. via_name carries
+# the name of the node through which the dependent was reached. GROUP BY id
+# with MIN(depth) keeps each dependent once at its shallowest level (the old
+# visited-set semantics), and the ORDER BY replaces the per-level Python
+# sorted(set(...)) passes with one SQL sort.
+_IMPACT_QUERY = """
+    WITH RECURSIVE impact(id, name, file_path, relation_type, depth, via_name) AS (
+        SELECT id, name, file_path, NULL, 0, name FROM nodes WHERE file_path = ?
+        UNION
+        SELECT n.id, n.name, n.file_path, e.relation_type, i.depth + 1, i.name
+        FROM impact i
+        JOIN edges e ON e.to_node_id = i.id
+        JOIN nodes n ON n.id = e.from_node_id
+        WHERE i.depth < 3
+    )
+    SELECT name, file_path, relation_type, MIN(depth) AS depth, via_name
+    FROM impact
+    WHERE depth > 0 AND file_path != ?
+    GROUP BY id
+    ORDER BY depth, file_path, name
+"""
+
+_IMPACT_LEVEL_HEADERS = {
+    1: "### Level 1: Direct Impact",
+    2: "### Level 2: Secondary Impact (Ripple Effect)",
+    3: "### Level 3: Deep Impact",
+}
+
+
+# Depth-bounded call-graph walk in a single query per direction, replacing the
+# old per-node recursion that issued one SELECT per hop (fan-out^depth
+# queries). The anchor matches every node with the given name (optionally
+# narrowed by file), so one query covers all start nodes of an ambiguous name;
+# start_id lets the handler group results per start. The path column carries
+# visited ids for cycle detection, and ordering by it yields the same
+# depth-first output as the recursive version. The LIMIT inside each CTE
+# (a SQLite extension) caps how many rows the recursion may ever enqueue, so
+# a dense graph stops expanding instead of materializing an unbounded walk.
+_WALK_UP_QUERY = """
+    WITH RECURSIVE walk(start_id, id, depth, name, file_path, relation_type,
+                        breadcrumb, path) AS (
+        SELECT id, id, 0, name, file_path, NULL, name, '|' || id || '|'
+        FROM nodes WHERE name = ? AND (? IS NULL OR file_path = ?)
+        UNION ALL
+        SELECT w.start_id, n.id, w.depth + 1, n.name, n.file_path, e.relation_type,
+               w.breadcrumb || ' > ' || n.name, w.path || n.id || '|'
+        FROM walk w
+        JOIN edges e ON e.to_node_id = w.id
+        JOIN nodes n ON n.id = e.from_node_id
+        WHERE w.depth < ? AND instr(w.path, '|' || n.id || '|') = 0
+        LIMIT ?
+    )
+    SELECT start_id, depth, name, file_path, relation_type, breadcrumb
+    FROM walk WHERE depth > 0 ORDER BY path
+"""
+
+_WALK_DOWN_QUERY = """
+    WITH RECURSIVE walk(start_id, id, depth, name, file_path, relation_type,
+                        breadcrumb, path) AS (
+        SELECT id, id, 0, name, file_path, NULL, name, '|' || id || '|'
+        FROM nodes WHERE name = ? AND (? IS NULL OR file_path = ?)
+        UNION ALL
+        SELECT w.start_id, n.id, w.depth + 1, n.name, n.file_path, e.relation_type,
+               w.breadcrumb || ' > ' || n.name, w.path || n.id || '|'
+        FROM walk w
+        JOIN edges e ON e.from_node_id = w.id
+        JOIN nodes n ON n.id = e.to_node_id
+        WHERE w.depth < ? AND instr(w.path, '|' || n.id || '|') = 0
+        LIMIT ?
+    )
+    SELECT start_id, depth, name, file_path, relation_type, breadcrumb
+    FROM walk WHERE depth > 0 ORDER BY path
+"""
+
+
+# Both directions of a BOTH trace in one statement: each walk is the same CTE
+# as its single-direction twin, tagged with a dir column so Python can split
+# the row stream. Saves a round trip on the default direction.
+_WALK_BOTH_QUERY = """
+    WITH RECURSIVE up(start_id, id, depth, name, file_path, relation_type,
+                      breadcrumb, path) AS (
+        SELECT id, id, 0, name, file_path, NULL, name, '|' || id || '|'
+        FROM nodes WHERE name = ? AND (? IS NULL OR file_path = ?)
+        UNION ALL
+        SELECT u.start_id, n.id, u.depth + 1, n.name, n.file_path, e.relation_type,
+               u.breadcrumb || ' > ' || n.name, u.path || n.id || '|'
+        FROM up u
+        JOIN edges e ON e.to_node_id = u.id
+        JOIN nodes n ON n.id = e.from_node_id
+        WHERE u.depth < ? AND instr(u.path, '|' || n.id || '|') = 0
+        LIMIT ?
+    ),
+    down(start_id, id, depth, name, file_path, relation_type,
+         breadcrumb, path) AS (
+        SELECT id, id, 0, name, file_path, NULL, name, '|' || id || '|'
+        FROM nodes WHERE name = ? AND (? IS NULL OR file_path = ?)
+        UNION ALL
+        SELECT d.start_id, n.id, d.depth + 1, n.name, n.file_path, e.relation_type,
+               d.breadcrumb || ' > ' || n.name, d.path || n.id || '|'
+        FROM down d
+        JOIN edges e ON e.from_node_id = d.id
+        JOIN nodes n ON n.id = e.to_node_id
+        WHERE d.depth < ? AND instr(d.path, '|' || n.id || '|') = 0
+        LIMIT ?
+    )
+    SELECT 'up' AS dir, start_id, depth, name, file_path, relation_type, breadcrumb, path
+    FROM up WHERE depth > 0
+    UNION ALL
+    SELECT 'down', start_id, depth, name, file_path, relation_type, breadcrumb, path
+    FROM down WHERE depth > 0
+    ORDER BY dir DESC, path
+"""
+
+
 class GraphTraverser:
     """Traverses the call graph and builds output."""
 
     def __init__(self, db: IndexerDB):
         self.db = db
-        self.visited: set[str] = set()
         self.output: list[str] = []
+        # Direction prefixes are constant per instance; build them once
+        # instead of per traverse call.
+        self._up_prefix = f"{_ARROW_UP} called by"
+        self._down_prefix = f"{_ARROW_DOWN} calls"
 
     def traverse(
         self,
-        current_id: str,
-        depth: int,
+        node_name: str,
+        file_filter: str | None,
         max_depth: int,
+        max_nodes: int,
         direction: Literal["up", "down"],
-        indent: int,
         conn,
-        path_stack: list[str] | None = None,
-    ):
-        """Recursively traverse the graph."""
-        if depth > max_depth:
-            return
-
-        if path_stack is None:
-            path_stack = []
+    ) -> dict[str, list[str]]:
+        """
+        Walk the graph from every node named node_name with one CTE query.
+
+        Returns formatted lines grouped by start node id, so the caller can
+        interleave them with per-start headers. The walk enqueues at most
+        max_nodes + 1 rows (anchors included); the +1 lets the caller tell
+        "exactly at the cap" from "truncated".
+        """
+        if direction == "up":
+            query = _WALK_UP_QUERY
+            prefix = self._up_prefix
+        else:
+            query = _WALK_DOWN_QUERY
+            prefix = self._down_prefix
 
-        # Check for cycles
-        if current_id in self.visited:
-            msg = _safe_str("🔄 [CYCLE DETECTED - circular dependency]")
-            self.output.append(f"{'  ' * indent}{msg}")
-            return
+        # Depth is bounded, so index a small precomputed table instead of
+        # re-multiplying the indent string per row.
+        indents = ["  " * i for i in range(max_depth)]
 
-        self.visited.add(current_id)
+        grouped: dict[str, list[str]] = {}
+        for start_id, depth, _name, file_path, relation_type, breadcrumb in conn.execute(
+            query, (node_name, file_filter, file_filter, max_depth, max_nodes + 1)
+        ):
+            grouped.setdefault(start_id, []).append(
+                f"{indents[depth - 1]}- {prefix} `{breadcrumb}` ({relation_type}) in `{file_path}`"
+            )
+        return grouped
 
-        if direction == "up":
-            query = """
-                SELECT e.from_node_id as neighbor_id, e.relation_type, n.name, n.file_path 
-                FROM edges e
-                JOIN nodes n ON e.from_node_id = n.id
-                WHERE e.to_node_id = ?
-            """
-            prefix = _safe_str("← called by")
-        else:
-            query = """
-                SELECT e.to_node_id as neighbor_id, e.relation_type, n.name, n.file_path 
-                FROM edges e
-                JOIN nodes n ON e.to_node_id = n.id
-                WHERE e.from_node_id = ?
-            """
-            prefix = _safe_str("→ calls")
-
-        cursor = conn.execute(query, (current_id,))
-        neighbors = cursor.fetchall()
-
-        for n in neighbors:
-            current_path = [*path_stack, n["name"]]
-            breadcrumb = " > ".join(current_path)
-
-            line = (
-                f"{'  ' * indent}- {prefix} `{breadcrumb}` ({n['relation_type']}) "
-                f"in `{n['file_path']}`"
+    def traverse_both(
+        self,
+        node_name: str,
+        file_filter: str | None,
+        max_depth: int,
+        max_nodes: int,
+        conn,
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+        """Run up and down walks in one statement; returns (up, down) groups.
+
+        max_nodes caps each direction's walk independently (see traverse).
+        """
+        indents = ["  " * i for i in range(max_depth)]
+        up: dict[str, list[str]] = {}
+        down: dict[str, list[str]] = {}
+        args = (node_name, file_filter, file_filter, max_depth, max_nodes + 1)
+        for row in conn.execute(_WALK_BOTH_QUERY, args + args):
+            dir_tag, start_id, depth, _name, file_path, relation_type, breadcrumb, _path = row
+            if dir_tag == "up":
+                grouped, prefix = up, self._up_prefix
+            else:
+                grouped, prefix = down, self._down_prefix
+            grouped.setdefault(start_id, []).append(
+                f"{indents[depth - 1]}- {prefix} `{breadcrumb}` ({relation_type}) in `{file_path}`"
             )
-            self.output.append(line)
-            self.traverse(
-                n["neighbor_id"], depth + 1, max_depth, direction, indent + 1, conn, current_path
+        return up, down
+
+    def collect(
+        self,
+        node_name: str,
+        file_filter: str | None,
+        max_depth: int,
+        max_nodes: int,
+        direction: Literal["up", "down"],
+        conn,
+    ) -> dict[str, list[dict]]:
+        """Like traverse, but returns structured rows for the JSON path."""
+        query = _WALK_UP_QUERY if direction == "up" else _WALK_DOWN_QUERY
+        grouped: dict[str, list[dict]] = {}
+        for start_id, depth, name, file_path, relation_type, breadcrumb in conn.execute(
+            query, (node_name, file_filter, file_filter, max_depth, max_nodes + 1)
+        ):
+            grouped.setdefault(start_id, []).append(
+                {
+                    "depth": depth,
+                    "name": name,
+                    "file_path": file_path,
+                    "relation_type": relation_type,
+                    "breadcrumb": breadcrumb,
+                }
             )
+        return grouped
 
 
 # =============================================================================
@@ -386,99 +739,153 @@ async def vibegraph_get_structural_summary(params: StructuralSummaryInput) -> st
         db, root = _get_context_for_path(params.file_path)
         normalized_path = _normalize_path(params.file_path, root)
 
-        with db._get_conn() as conn:
-            # Get total count
-            count_cursor = conn.execute(
-                "SELECT COUNT(*) FROM nodes WHERE file_path = ?", (normalized_path,)
-            )
-            total = count_cursor.fetchone()[0]
-
-            # Get paginated results
-            cursor = conn.execute(
-                """SELECT id, name, kind, signature, start_line, end_line, decorators, visibility 
-                   FROM nodes 
-                   WHERE file_path = ? 
-                   ORDER BY start_line
-                   LIMIT ? OFFSET ?""",
-                (normalized_path, params.limit, params.offset),
-            )
-            rows = cursor.fetchall()
+        use_keyset = params.after_line is not None
+
+        def _run() -> str:
+            with db._get_conn() as conn:
+                # Both branches fetch limit+1 rows: the sentinel row answers
+                # has_more without a COUNT.
+                if use_keyset:
+                    cursor = conn.execute(
+                        _SUMMARY_KEYSET_QUERY,
+                        (
+                            normalized_path,
+                            params.after_line,
+                            params.after_id or "",
+                            params.limit + 1,
+                        ),
+                    )
+                else:
+                    cursor = conn.execute(
+                        _SUMMARY_OFFSET_QUERY,
+                        (normalized_path, params.limit + 1, params.offset),
+                    )
+                rows = cursor.fetchall()
+                has_more = len(rows) > params.limit
+                if has_more:
+                    rows = rows[: params.limit]
+
+                # The common case — a small file's first page — derives total from
+                # the page itself and skips the COUNT index scan entirely. The
+                # scan only runs when the header needs the real total (more pages,
+                # keyset mode) or to distinguish an unindexed file from a page
+                # past the end.
+                if use_keyset or has_more or not rows:
+                    total = conn.execute(_COUNT_NODES_QUERY, (normalized_path,)).fetchone()[0]
+                else:
+                    total = params.offset + len(rows)
 
-        if total == 0:
-            return (
-                f"No structure found for {params.file_path}. "
-                "File might not be indexed. Try vibegraph_reindex_project first."
-            )
+            if total == 0:
+                return (
+                    f"No structure found for {params.file_path}. "
+                    "File might not be indexed. Try vibegraph_reindex_project first."
+                )
 
-        # JSON format
-        if params.response_format == ResponseFormat.JSON:
-            nodes = [
-                {
-                    "name": row["name"],
-                    "kind": row["kind"],
-                    "signature": row["signature"],
-                    "start_line": row["start_line"],
-                    "end_line": row["end_line"],
-                    "decorators": json.loads(row["decorators"]) if row["decorators"] else [],
-                    "visibility": row["visibility"] or "public",
+            # JSON format (enum members are singletons, so identity is enough)
+            if params.response_format is ResponseFormat.JSON:
+                nodes = [
+                    {
+                        "name": row["name"],
+                        "kind": row["kind"],
+                        "signature": row["signature"],
+                        "start_line": row["start_line"],
+                        "end_line": row["end_line"],
+                        "decorators": (
+                            json.loads(d) if (d := row["decorators"]) and d != "[]" else []
+                        ),
+                        "visibility": row["visibility"] or "public",
+                    }
+                    for row in rows
+                ]
+                response = {
+                    "file_path": normalized_path,
+                    "total": total,
+                    "count": len(nodes),
+                    "offset": params.offset,
+                    "has_more": has_more,
+                    "next_offset": (
+                        params.offset + len(nodes) if has_more and not use_keyset else None
+                    ),
+                    "next_cursor": (
+                        {"after_line": rows[-1]["start_line"], "after_id": rows[-1]["id"]}
+                        if has_more and rows
+                        else None
+                    ),
+                    "nodes": nodes,
                 }
-                for row in rows
-            ]
-            response = {
-                "file_path": normalized_path,
-                "total": total,
-                "count": len(nodes),
-                "offset": params.offset,
-                "has_more": total > params.offset + len(nodes),
-                "next_offset": (
-                    params.offset + len(nodes) if total > params.offset + len(nodes) else None
-                ),
-                "nodes": nodes,
-            }
-            return json.dumps(response, indent=2)
-
-        # Markdown format (default)
-        end_idx = min(params.offset + len(rows), total)
-        summary = [
-            f"Structure for `{normalized_path}` (showing {params.offset + 1}-{end_idx} "
-            f"of {total} nodes):\n"
-        ]
-
-        for row in rows:
-            icon = "[f]"
-            if row["kind"] == "class":
-                icon = "[c]"
-            elif row["kind"] == "module":
-                icon = "[m]"
-
-            vis_mark = ""
-            if row["visibility"] == "private":
-                vis_mark = " 🔒"
-            elif row["visibility"] == "exported":
-                vis_mark = " 🌐"
-
-            decorators = ""
-            if row["decorators"]:
-                decs = json.loads(row["decorators"])
-                for d in decs:
-                    decorators += f"\n  {d}"
-
-            info = f"- {icon} **{row['name']}**{vis_mark}"
-            if row["signature"]:
-                info += f" `{row['signature']}`"
-            info += f" (L{row['start_line']}-{row['end_line']})"
-            if decorators:
-                info += decorators
-            summary.append(info)
-
-        if end_idx < total:
-            remaining = total - end_idx
-            next_offset = params.offset + params.limit
-            summary.append(
-                f"\n... {remaining} more nodes available (use offset={next_offset} to see more)"
-            )
+                # Compact separators: the JSON path serves machine consumers, and
+                # indent=2 roughly doubles both the serialize work and the payload.
+                return json.dumps(response, separators=(",", ":"))
+
+            # Markdown format (default). A StringIO buffer grows geometrically in
+            # C, avoiding the intermediate list of per-row strings that
+            # "\n".join() would re-walk for large pages.
+            summary = io.StringIO()
+            if use_keyset:
+                summary.write(
+                    f"Structure for `{normalized_path}` "
+                    f"({len(rows)} of {total} nodes after L{params.after_line}):\n"
+                )
+            else:
+                end_idx = min(params.offset + len(rows), total)
+                summary.write(
+                    f"Structure for `{normalized_path}` (showing {params.offset + 1}-{end_idx} "
+                    f"of {total} nodes):\n"
+                )
 
-        return "\n".join(summary)
+            # Positional unpacking (SELECT column order): one UNPACK_SEQUENCE per
+            # row instead of a by-name lookup per column access.
+            for (
+                _node_id,
+                name,
+                kind,
+                signature,
+                start_line,
+                end_line,
+                decs_json,
+                visibility,
+            ) in rows:
+                icon = "[f]"
+                if kind == "class":
+                    icon = "[c]"
+                elif kind == "module":
+                    icon = "[m]"
+
+                vis_mark = ""
+                if visibility == "private":
+                    vis_mark = " 🔒"
+                elif visibility == "exported":
+                    vis_mark = " 🌐"
+
+                # Most nodes carry no decorators; skip the JSON parse entirely then
+                decorators = ""
+                if decs_json and decs_json != "[]":
+                    decorators = "".join(f"\n  {d}" for d in json.loads(decs_json))
+
+                summary.write(f"\n- {icon} **{name}**{vis_mark}")
+                if signature:
+                    summary.write(f" `{signature}`")
+                summary.write(f" (L{start_line}-{end_line})")
+                if decorators:
+                    summary.write(decorators)
+
+            if has_more and rows:
+                if use_keyset:
+                    summary.write(
+                        f"\n\n... more nodes available (use after_line={rows[-1]['start_line']}, "
+                        f"after_id={rows[-1]['id']} to see more)"
+                    )
+                else:
+                    remaining = total - end_idx
+                    next_offset = params.offset + params.limit
+                    summary.write(
+                        f"\n\n... {remaining} more nodes available "
+                        f"(use offset={next_offset} to see more)"
+                    )
+
+            return summary.getvalue()
+
+        return await asyncio.to_thread(_run)
 
     except Exception as e:
         return _handle_error(e, f"analyzing {params.file_path}")
@@ -507,6 +914,7 @@ async def vibegraph_get_call_stack(params: CallStackInput) -> str:
             - file_path (str|None): Optional path to disambiguate (e.g., "src/parser.py")
             - direction (str): "up", "down", or "both" (default: "both")
             - depth (int): Max traversal depth 1-10 (default: 1)
+            - max_nodes (int): Cap on traversal rows per direction (default: 5000)
 
     Returns:
         str: Markdown-formatted call graph showing:
@@ -526,58 +934,129 @@ async def vibegraph_get_call_stack(params: CallStackInput) -> str:
     try:
         db, root = _get_context_for_path(params.file_path)
 
-        with db._get_conn() as conn:
-            query = "SELECT id, name, file_path, kind FROM nodes WHERE name = ?"
-            query_params: list = [params.node_name]
-
-            if params.file_path:
-                query += " AND file_path = ?"
-                query_params.append(_normalize_path(params.file_path, root))
-
-            cursor = conn.execute(query, tuple(query_params))
-            start_nodes = cursor.fetchall()
-
-            if not start_nodes:
-                return f"Node '{params.node_name}' not found. Is the file indexed?"
-
-            traverser = GraphTraverser(db)
-
-            for start_node in start_nodes:
-                traverser.output.append(
-                    f"### Trace for `{start_node['name']}` ({start_node['kind']}) "
-                    f"in `{start_node['file_path']}`"
-                )
+        def _run() -> str:
+            with db._get_conn() as conn:
+                file_filter = None
+                if params.file_path:
+                    file_filter = _normalize_path(params.file_path, root)
+                    cursor = conn.execute(
+                        _NODE_LOOKUP_BY_FILE_QUERY, (params.node_name, file_filter)
+                    )
+                else:
+                    cursor = conn.execute(_NODE_LOOKUP_QUERY, (params.node_name,))
+                start_nodes = cursor.fetchall()
+
+                if not start_nodes:
+                    return f"Node '{params.node_name}' not found. Is the file indexed?"
+
+                traverser = GraphTraverser(db)
+
+                # Resolve the direction once; the per-node loop then does plain
+                # bool checks instead of repeated enum membership tests.
+                trace_up = params.direction is not TraceDirection.DOWN
+                trace_down = params.direction is not TraceDirection.UP
+
+                # The CTE cap counts the depth-0 anchor rows too, so widen the
+                # budget by the anchor count: max_nodes then bounds exactly the
+                # rows a direction may return, and the +1 sentinel inside the
+                # walk marks truncation precisely.
+                walk_budget = params.max_nodes + len(start_nodes)
+
+                def _truncated(grouped: dict) -> bool:
+                    return sum(len(rows) for rows in grouped.values()) > params.max_nodes
+
+                if params.response_format is ResponseFormat.JSON:
+                    up_rows = (
+                        traverser.collect(
+                            params.node_name,
+                            file_filter,
+                            params.depth,
+                            walk_budget,
+                            "up",
+                            conn,
+                        )
+                        if trace_up
+                        else {}
+                    )
+                    down_rows = (
+                        traverser.collect(
+                            params.node_name,
+                            file_filter,
+                            params.depth,
+                            walk_budget,
+                            "down",
+                            conn,
+                        )
+                        if trace_down
+                        else {}
+                    )
+                    traces = []
+                    for start_node in start_nodes:
+                        trace: dict = {
+                            "name": start_node["name"],
+                            "kind": start_node["kind"],
+                            "file_path": start_node["file_path"],
+                        }
+                        if trace_up:
+                            trace["callers"] = up_rows.get(start_node["id"], [])
+                        if trace_down:
+                            trace["callees"] = down_rows.get(start_node["id"], [])
+                        traces.append(trace)
+                    response = {"node_name": params.node_name, "traces": traces}
+                    if _truncated(up_rows) or _truncated(down_rows):
+                        response["truncated"] = True
+                        response["max_nodes"] = params.max_nodes
+                    return json.dumps(response, separators=(",", ":"))
+
+                # One statement covers every start node — and both directions at
+                # once on the default BOTH path; results come back grouped by
+                # start id.
+                up_lines: dict[str, list[str]] = {}
+                down_lines: dict[str, list[str]] = {}
+                if trace_up and trace_down:
+                    up_lines, down_lines = traverser.traverse_both(
+                        params.node_name, file_filter, params.depth, walk_budget, conn
+                    )
+                elif trace_up:
+                    up_lines = traverser.traverse(
+                        params.node_name, file_filter, params.depth, walk_budget, "up", conn
+                    )
+                else:
+                    down_lines = traverser.traverse(
+                        params.node_name, file_filter, params.depth, walk_budget, "down", conn
+                    )
 
-                if params.direction in (TraceDirection.UP, TraceDirection.BOTH):
-                    traverser.output.append("\n**Callers (Incoming):**")
-                    traverser.traverse(
-                        start_node["id"],
-                        1,
-                        params.depth,
-                        "up",
-                        0,
-                        conn,
-                        path_stack=[start_node["name"]],
+                for start_node in start_nodes:
+                    traverser.output.append(
+                        f"### Trace for `{start_node['name']}` ({start_node['kind']}) "
+                        f"in `{start_node['file_path']}`"
                     )
-                    if not any(_safe_str("←") in line for line in traverser.output[-5:]):
-                        traverser.output.append("  (no callers found)")
-                    traverser.visited.clear()
-
-                if params.direction in (TraceDirection.DOWN, TraceDirection.BOTH):
-                    traverser.output.append("\n**Callees (Outgoing):**")
-                    traverser.traverse(
-                        start_node["id"],
-                        1,
-                        params.depth,
-                        "down",
-                        0,
-                        conn,
-                        path_stack=[start_node["name"]],
+
+                    if trace_up:
+                        traverser.output.append("\n**Callers (Incoming):**")
+                        lines = up_lines.get(start_node["id"])
+                        if lines:
+                            traverser.output.extend(lines)
+                        else:
+                            traverser.output.append("  (no callers found)")
+
+                    if trace_down:
+                        traverser.output.append("\n**Callees (Outgoing):**")
+                        lines = down_lines.get(start_node["id"])
+                        if lines:
+                            traverser.output.extend(lines)
+                        else:
+                            traverser.output.append("  (no callees found)")
+
+                if _truncated(up_lines) or _truncated(down_lines):
+                    traverser.output.append(
+                        f"\n⚠️ Trace truncated at max_nodes={params.max_nodes}; "
+                        "narrow with file_path or reduce depth for a complete walk."
                     )
-                    if not any(_safe_str("→") in line for line in traverser.output[-5:]):
-                        traverser.output.append("  (no callees found)")
 
-        return "\n".join(traverser.output)
+            return "\n".join(traverser.output)
+
+        return await asyncio.to_thread(_run)
 
     except Exception as e:
         return _handle_error(e, f"tracing {params.node_name}")
@@ -625,88 +1104,63 @@ async def vibegraph_impact_analysis(params: ImpactAnalysisInput) -> str:
         db, root = _get_context_for_path(params.file_path)
         normalized_path = _normalize_path(params.file_path, root)
 
-        with db._get_conn() as conn:
-            cursor = conn.execute(
-                "SELECT id, name FROM nodes WHERE file_path = ?", (normalized_path,)
-            )
-            file_nodes = cursor.fetchall()
-
-            if not file_nodes:
-                return f"No nodes found in {params.file_path}. Is it indexed?"
-
-            # BFS for transitive impact
-            # Queue: (node_id, depth, path_description)
-            queue = [(n["id"], 0, n["name"]) for n in file_nodes]
-            visited = {n["id"] for n in file_nodes}
-
-            # Storage for results: level -> list of strings
-            impacts_by_level = {1: [], 2: [], 3: []}
-            total_impact = 0
-
-            while queue:
-                curr_id, depth, path_desc = queue.pop(0)
-
-                if depth >= 3:
-                    continue
-
-                # dependencies: who calls/uses curr_id?
-                query = """
-                    SELECT DISTINCT n.id, n.name, n.file_path, n.kind, e.relation_type
-                    FROM edges e
-                    JOIN nodes n ON e.from_node_id = n.id
-                    WHERE e.to_node_id = ?
-                """
-                cursor = conn.execute(query, (curr_id,))
-                dependents = cursor.fetchall()
-
-                for dep in dependents:
-                    # Avoid cycles and self-references within the same original file
-                    if dep["id"] in visited:
-                        continue
+        def _run() -> str:
+            with db._get_conn() as conn:
+                if conn.execute(_FILE_HAS_NODES_QUERY, (normalized_path,)).fetchone() is None:
+                    return f"No nodes found in {params.file_path}. Is it indexed?"
+
+                # Single recursive CTE replaces the former Python BFS that issued
+                # one SELECT per visited node; dedup and ordering happen in SQL,
+                # so each dependent arrives once, sorted and grouped by depth.
+                rows = conn.execute(_IMPACT_QUERY, (normalized_path, normalized_path)).fetchall()
+
+                if params.response_format is ResponseFormat.JSON:
+                    return json.dumps(
+                        {
+                            "file_path": normalized_path,
+                            "total_impact": len(rows),
+                            "impacts": [
+                                {
+                                    "level": row["depth"],
+                                    "name": row["name"],
+                                    "file_path": row["file_path"],
+                                    "depends_on": row["via_name"],
+                                    "relation_type": row["relation_type"],
+                                }
+                                for row in rows
+                            ],
+                        },
+                        separators=(",", ":"),
+                    )
 
-                    # We only care about external impact for the report, but we traverse everything
-                    # to find transitive impacts.
+                # Stream into one buffer instead of accumulating list pieces
+                # and joining; level bodies append without intermediate strings.
+                output = io.StringIO()
+                output.write(f"## Impact Analysis for `{normalized_path}`")
 
-                    next_depth = depth + 1
+                if not rows:
+                    output.write(
+                        "\n✅ No external dependencies found. Safe to refactor internally."
+                    )
+                else:
+                    output.write(
+                        f"\n**Total Impact**: {len(rows)} components affected up to 3 levels.\n"
+                    )
 
-                    if dep["file_path"] != normalized_path:
-                        # It's an external impact
-                        if next_depth <= 3:
-                            entry = (
-                                f"- **`{dep['name']}`** (`{dep['file_path']}`) "
-                                f"depends on `{path_desc}` via `{dep['relation_type']}`"
+                    for depth, level_rows in itertools.groupby(rows, key=lambda r: r["depth"]):
+                        output.write(f"\n{_IMPACT_LEVEL_HEADERS[depth]}\n")
+                        output.write(
+                            "\n".join(
+                                f"- **`{row['name']}`** (`{row['file_path']}`) "
+                                f"depends on `{row['via_name']}` via `{row['relation_type']}`"
+                                for row in level_rows
                             )
-                            impacts_by_level[next_depth].append(entry)
-                            total_impact += 1
-
-                    visited.add(dep["id"])
-                    queue.append((dep["id"], next_depth, dep["name"]))
-
-            output = [f"## Impact Analysis for `{normalized_path}`"]
-
-            if total_impact == 0:
-                output.append("✅ No external dependencies found. Safe to refactor internally.")
-            else:
-                output.append(
-                    f"**Total Impact**: {total_impact} components affected up to 3 levels.\n"
-                )
-
-                if impacts_by_level[1]:
-                    output.append("### Level 1: Direct Impact")
-                    output.extend(sorted(set(impacts_by_level[1])))
-                    output.append("")
-
-                if impacts_by_level[2]:
-                    output.append("### Level 2: Secondary Impact (Ripple Effect)")
-                    output.extend(sorted(set(impacts_by_level[2])))
-                    output.append("")
+                        )
+                        output.write("\n")
 
-                if impacts_by_level[3]:
-                    output.append("### Level 3: Deep Impact")
-                    output.extend(sorted(set(impacts_by_level[3])))
-                    output.append("")
+            return output.getvalue()
 
-        return "\n".join(output)
+        return await asyncio.to_thread(_run)
 
     except Exception as e:
         return _handle_error(e, f"analyzing impact for {params.file_path}")
@@ -738,43 +1192,77 @@ async def vibegraph_find_references(params: ReferencesInput) -> str:
     try:
         # Use scope_path to determine project root/DB context
         db, _ = _get_context_for_path(params.scope_path)
-        with db._get_conn() as conn:
-            # First find potential target node IDs by name
-            # (There might be multiple if same name used in diff files)
-            cursor = conn.execute(
-                "SELECT id, name, file_path FROM nodes WHERE name = ?", (params.symbol_name,)
-            )
-            targets = cursor.fetchall()
 
-            if not targets:
-                return f"Symbol '{params.symbol_name}' not found in index."
+        def _run() -> str:
+            with db._get_conn() as conn:
+                # One query returns every matching target alongside its referrers
+                # (there might be multiple targets if the same name is used in
+                # different files), instead of one lookup plus one query per target.
+                rows = conn.execute(_REFERENCES_QUERY, (params.symbol_name,)).fetchall()
+
+                if not rows:
+                    return f"Symbol '{params.symbol_name}' not found in index."
+
+                if params.response_format is ResponseFormat.JSON:
+                    targets = []
+                    for _target_id, target_rows in itertools.groupby(
+                        rows, key=lambda r: r["target_id"]
+                    ):
+                        refs = list(target_rows)
+                        first = refs[0]
+                        targets.append(
+                            {
+                                "name": first["target_name"],
+                                "file_path": first["target_file"],
+                                "references": (
+                                    []
+                                    if first["name"] is None
+                                    else [
+                                        {
+                                            "name": ref["name"],
+                                            "file_path": ref["file_path"],
+                                            "line": ref["start_line"],
+                                            "relation_type": ref["relation_type"],
+                                        }
+                                        for ref in refs
+                                    ]
+                                ),
+                            }
+                        )
+                    return json.dumps(
+                        {"symbol": params.symbol_name, "targets": targets},
+                        separators=(",", ":"),
+                    )
 
-            output = [f"## References to `{params.symbol_name}`"]
+                output = [f"## References to `{params.symbol_name}`"]
 
-            for target in targets:
-                target_desc = f"`{target['name']}` from `{target['file_path']}`"
+                for _target_id, target_rows in itertools.groupby(
+                    rows, key=lambda r: r["target_id"]
+                ):
+                    refs = list(target_rows)
+                    first = refs[0]
+                    target_desc = f"`{first['target_name']}` from `{first['target_file']}`"
 
-                # Query incoming edges of type 'calls' or 'references'
-                query = """
-                    SELECT n.name, n.file_path, n.start_line, e.relation_type
-                    FROM edges e
-                    JOIN nodes n ON e.from_node_id = n.id
-                    WHERE e.to_node_id = ? AND e.relation_type IN ('calls', 'references')
-                """
-                cursor = conn.execute(query, (target["id"],))
-                refs = cursor.fetchall()
+                    # A lone row with NULL referrer columns means the LEFT JOIN
+                    # found no usages for this target.
+                    if first["name"] is None:
+                        output.append(f"\n### Usages of {target_desc}\n- No direct calls found.")
+                        continue
 
-                if refs:
-                    output.append(f"\n### Usages of {target_desc}")
-                    for ref in refs:
-                        output.append(
+                    # One join builds the section body in a single buffer instead
+                    # of appending (and later re-joining) a string per referrer.
+                    output.append(
+                        f"\n### Usages of {target_desc}\n"
+                        + "\n".join(
                             f"- Used by `{ref['name']}` in `{ref['file_path']}` "
                             f"(L{ref['start_line']}) [{ref['relation_type']}]"
+                            for ref in refs
                         )
-                else:
-                    output.append(f"\n### Usages of {target_desc}\n- No direct calls found.")
+                    )
 
-        return "\n".join(output)
+            return "\n".join(output)
+
+        return await asyncio.to_thread(_run)
     except Exception as e:
         return _handle_error(e, f"finding references for {params.symbol_name}")
 
@@ -806,78 +1294,58 @@ async def vibegraph_get_dependencies(params: DependenciesInput) -> str:
         db, root = _get_context_for_path(params.file_path)
         normalized_path = _normalize_path(params.file_path, root)
 
-        with db._get_conn() as conn:
-            # Get outgoing import edges
-            query = """
-                SELECT DISTINCT n_to.name, n_to.file_path, n_to.kind
-                FROM nodes n_from
-                JOIN edges e ON n_from.id = e.from_node_id
-                JOIN nodes n_to ON e.to_node_id = n_to.id
-                WHERE n_from.file_path = ? AND e.relation_type = 'imports'
-             """
-
-            cursor = conn.execute(query, (normalized_path,))
-            deps = cursor.fetchall()
-
-            # stdlib check
-            try:
-                import sys
-
-                stdlib_names = sys.stdlib_module_names
-            except Exception:
-                stdlib_names = {
-                    "os",
-                    "sys",
-                    "pathlib",
-                    "json",
-                    "typing",
-                    "subprocess",
-                    "hashlib",
-                    "re",
-                    "math",
-                    "datetime",
-                    "sqlite3",
-                    "abc",
-                }
-
-            internal = []
-            stdlib = []
-            third_party = []
-
-            for dep in deps:
-                name = dep["name"]
-                path = dep["file_path"]
+        def _run() -> str:
+            with db._get_conn() as conn:
+                _ensure_stdlib_table(conn)
+                deps = conn.execute(_DEPS_QUERY, (normalized_path,)).fetchall()
+
+                # Rows come back bucketed and name-sorted by the query
+                internal = [dep for dep in deps if dep["bucket"] == "internal"]
+                stdlib = [dep for dep in deps if dep["bucket"] == "stdlib"]
+                third_party = [dep for dep in deps if dep["bucket"] == "third_party"]
+
+                if params.response_format is ResponseFormat.JSON:
+                    return json.dumps(
+                        {
+                            "file_path": normalized_path,
+                            "internal": [
+                                {"name": dep["name"], "file_path": dep["file_path"]}
+                                for dep in internal
+                            ],
+                            "third_party": [dep["name"] for dep in third_party],
+                            "stdlib": [dep["name"] for dep in stdlib],
+                        },
+                        separators=(",", ":"),
+                    )
 
-                if path != "external":
-                    internal.append(dep)
-                else:
-                    root_pkg = name.split(".")[0]
-                    if root_pkg in stdlib_names:
-                        stdlib.append(dep)
-                    else:
-                        third_party.append(dep)
+                output = [f"## Dependencies for `{normalized_path}`"]
 
-            output = [f"## Dependencies for `{normalized_path}`"]
+                if internal:
+                    output.append(
+                        "\n### 🏠 Internal Project Modules\n"
+                        + "\n".join(
+                            f"- **{dep['name']}** (`{dep['file_path']}`)" for dep in internal
+                        )
+                    )
 
-            if internal:
-                output.append("\n### 🏠 Internal Project Modules")
-                for dep in internal:
-                    output.append(f"- **{dep['name']}** (`{dep['file_path']}`)")
+                if third_party:
+                    output.append(
+                        "\n### 📦 Third-Party Packages\n"
+                        + "\n".join(f"- **{dep['name']}**" for dep in third_party)
+                    )
 
-            if third_party:
-                output.append("\n### 📦 Third-Party Packages")
-                for dep in third_party:
-                    output.append(f"- **{dep['name']}**")
+                if stdlib:
+                    output.append(
+                        "\n### 🐍 Standard Library\n"
+                        + "\n".join(f"- {dep['name']}" for dep in stdlib)
+                    )
 
-            if stdlib:
-                output.append("\n### 🐍 Standard Library")
-                for dep in stdlib:
-                    output.append(f"- {dep['name']}")
+                if not (internal or third_party or stdlib):
+                    output.append("No explicit imports found in index.")
 
-            if not (internal or third_party or stdlib):
-                output.append("No explicit imports found in index.")
+            return "\n".join(output)
 
-        return "\n".join(output)
+        return await asyncio.to_thread(_run)
     except Exception as e:
         return _handle_error(e, f"getting dependencies for {params.file_path}")
 
@@ -906,29 +1374,73 @@ async def vibegraph_search_by_signature(params: SearchInput) -> str:
     """
     try:
         db, _ = _get_context_for_path(params.scope_path)
-        with db._get_conn() as conn:
-            query = (
-                "SELECT name, signature, file_path, start_line "
-                "FROM nodes WHERE signature LIKE ? LIMIT 50"
-            )
-            cursor = conn.execute(query, (params.pattern,))
-            rows = cursor.fetchall()
 
-            output = [f"## Signature Search: `{params.pattern}`"]
-            if not rows:
-                output.append("No matches found.")
-            else:
-                for row in rows:
-                    output.append(
-                        f"- **`{row['name']}`**: `{row['signature']}`\n"
-                        f"  - In `{row['file_path']}`:L{row['start_line']}"
+        def _run() -> str:
+            with db._get_conn() as conn:
+                # Indexed token-phrase match first; LIKE remains the safety net
+                # for partial-token patterns, FTS-less builds, and empty results
+                # (FTS only matches whole tokens, LIKE matches any substring).
+                # Peeking one row instead of fetchall lets the rest stream
+                # straight from the cursor without materializing the page.
+                cursor = first = None
+                phrase = _fts_phrase(params.pattern) if db.has_fts else None
+                if phrase:
+                    try:
+                        cursor = conn.execute(_SIG_FTS_QUERY, (phrase,))
+                        first = cursor.fetchone()
+                    except sqlite3.OperationalError:
+                        cursor = None
+                if first is None:
+                    cursor = conn.execute(_SIG_LIKE_QUERY, (params.pattern,))
+                    first = cursor.fetchone()
+
+                if params.response_format is ResponseFormat.JSON:
+                    matches = (
+                        []
+                        if first is None
+                        else [
+                            {
+                                "name": name,
+                                "signature": signature,
+                                "file_path": file_path,
+                                "start_line": start_line,
+                            }
+                            for name, signature, file_path, start_line in itertools.chain(
+                                [first], cursor
+                            )
+                        ]
+                    )
+                    return json.dumps(
+                        {"pattern": params.pattern, "matches": matches},
+                        separators=(",", ":"),
                     )
 
-        return "\n".join(output)
+                output = [f"## Signature Search: `{params.pattern}`"]
+                if first is None:
+                    output.append("No matches found.")
+                else:
+                    for name, signature, file_path, start_line in itertools.chain([first], cursor):
+                        output.append(
+                            f"- **`{name}`**: `{signature}`\n  - In `{file_path}`:L{start_line}"
+                        )
+
+            return "\n".join(output)
+
+        return await asyncio.to_thread(_run)
     except Exception as e:
         return _handle_error(e, f"searching signature {params.pattern}")
 
 
+# Reindex runs on a dedicated single worker: a large repo walk can take
+# minutes, and returning a job id keeps the MCP stdio loop serving other
+# tools meanwhile. One worker also serializes overlapping reindex requests
+# against the same database. Futures are retained by job id for status polls.
+_reindex_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="vibegraph-reindex"
+)
+_reindex_jobs: dict[str, concurrent.futures.Future] = {}
+
+
 @mcp.tool(
     name="vibegraph_reindex_project",
     annotations={
@@ -952,7 +1464,8 @@ async def vibegraph_reindex_project(params: ReindexInput) -> str:
             - path (str): Path to index - file, directory, or "." for project root
 
     Returns:
-        str: Success message with path indexed, or error message
+        str: Job id of the background reindex, or error message. Poll
+            vibegraph_reindex_status with the job id for completion.
 
     Examples:
         - "Index the current project" -> path="."
@@ -966,19 +1479,74 @@ async def vibegraph_reindex_project(params: ReindexInput) -> str:
 
     Error Handling:
         - Returns error message if path doesn't exist
-        - Continues on individual file errors, reports overall success
+        - Continues on individual file errors; failures surface via
+          vibegraph_reindex_status
     """
     try:
+        # The filesystem (and possibly the project layout) is about to change,
+        # so drop cached roots and pooled DB handles first.
+        _invalidate_context_cache()
         db, _ = _get_context_for_path(params.path)
-        target_path = Path(params.path).resolve()
+        target_path = _resolve_cached(params.path)
 
-        with redirect_stdout(sys.stderr):
-            reindex_all(db, str(target_path), verbose=True)
-        return _safe_str(f"✅ Successfully reindexed: {target_path}")
+        # verbose=False: per-file progress prints would otherwise hit the MCP
+        # stdio transport (previously guarded by redirecting stdout to stderr).
+        def _job() -> None:
+            try:
+                reindex_all(db, str(target_path), False)
+            finally:
+                # The tree just changed; cached resolutions may point at
+                # moved paths
+                _RESOLVED_CACHE.clear()
+
+        job_id = uuid.uuid4().hex[:12]
+        _reindex_jobs[job_id] = _reindex_executor.submit(_job)
+        return (
+            f"Started reindex job {job_id} for {target_path}. "
+            f"Check it with vibegraph_reindex_status(job_id='{job_id}')."
+        )
     except Exception as e:
         return _handle_error(e, f"reindexing {params.path}")
 
 
+@mcp.tool(
+    name="vibegraph_reindex_status",
+    annotations={
+        "title": "Check Reindex Job Status",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },  # type: ignore
+)
+async def vibegraph_reindex_status(params: ReindexStatusInput) -> str:
+    """
+    Report the state of a background reindex job.
+
+    Args:
+        params (ReindexStatusInput): Validated input parameters containing:
+            - job_id (str): Id returned by vibegraph_reindex_project
+
+    Returns:
+        str: "running", "done", or the error the job raised.
+
+    Error Handling:
+        - Returns "Unknown reindex job" for ids this server never issued
+    """
+    try:
+        future = _reindex_jobs.get(params.job_id)
+        if future is None:
+            return f"Unknown reindex job '{params.job_id}'."
+        if not future.done():
+            return f"Reindex job {params.job_id}: running"
+        error = future.exception()
+        if error is not None:
+            return f"Reindex job {params.job_id}: error ({type(error).__name__}): {error}"
+        return _safe_str(f"✅ Reindex job {params.job_id}: done")
+    except Exception as e:
+        return _handle_error(e, f"checking reindex job {params.job_id}")
+
+
 # =============================================================================
 # Entry Point
 # =============================================================================
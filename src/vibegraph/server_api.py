@@ -1,7 +1,9 @@
 import asyncio
+import json
+import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from vibegraph.indexer.db import IndexerDB
@@ -21,13 +23,80 @@ class ConnectionManager:
         self.active_connections.remove(websocket)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        # Fan out concurrently: one slow client no longer stalls the rest.
+        # return_exceptions keeps the gather alive past dead sockets, which
+        # are then dropped so they don't accumulate.
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception) and connection in self.active_connections:
+                self.disconnect(connection)
 
 
 manager = ConnectionManager()
 db = IndexerDB()
 
+# Stable column orders for /graph payloads; the queries below select in
+# exactly this order.
+_NODE_COLUMNS = [
+    "id",
+    "name",
+    "kind",
+    "file_path",
+    "start_line",
+    "end_line",
+    "signature",
+    "docstring",
+    "decorators",
+    "visibility",
+]
+_EDGE_COLUMNS = ["id", "from_node_id", "to_node_id", "relation_type"]
+
+# A file's nodes and its touching edges in one statement: node rows tagged
+# 'n', edge rows tagged 'e' with NULL padding out to the node width, split in
+# Python on the tag. One round trip instead of nodes-then-edges, no node-id
+# list to expand into placeholders, and the f_nodes CTE is scanned once for
+# both sides.
+_GRAPH_FOR_FILE_QUERY = """
+    WITH f_nodes AS (SELECT * FROM nodes WHERE file_path = ?)
+    SELECT 'n' AS row_kind, id, name, kind, file_path, start_line, end_line,
+           signature, docstring, decorators, visibility
+    FROM f_nodes
+    UNION ALL
+    SELECT 'e', e.id, e.from_node_id, e.to_node_id, e.relation_type,
+           NULL, NULL, NULL, NULL, NULL, NULL
+    FROM edges e
+    WHERE e.from_node_id IN (SELECT id FROM f_nodes)
+       OR e.to_node_id IN (SELECT id FROM f_nodes)
+"""
+
+
+# Serialized /graph responses keyed by (file_path, columnar). The endpoint is
+# read-only between reindexes, so a cached body is valid as long as the
+# database fingerprint (mtime of the db file and its WAL) hasn't moved;
+# polling UIs then skip both the queries and the re-serialization.
+_graph_cache: dict[tuple[str | None, bool], tuple[int, str]] = {}
+
+
+def _db_fingerprint() -> int | None:
+    """Latest mtime_ns across the db file and its WAL, or None if unreadable.
+
+    Under WAL journaling commits land in the -wal file first; the main db
+    file's mtime alone would miss writes until a checkpoint.
+    """
+    try:
+        stamp = os.stat(db.db_path).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        stamp = max(stamp, os.stat(db.db_path + "-wal").st_mtime_ns)
+    except OSError:
+        pass
+    return stamp
+
 
 # Lifespan for Watcher
 @asynccontextmanager
@@ -36,9 +105,12 @@ async def lifespan(app: FastAPI):
     # We need to run the async broadcast from the sync watchdog callback
     loop = asyncio.get_running_loop()
 
-    def on_change():
-        # Schedule the broadcast coroutine in the event loop
-        asyncio.run_coroutine_threadsafe(manager.broadcast("refresh"), loop)
+    def on_change(changed_path: str):
+        # Schedule the broadcast coroutine in the event loop. Clients get a
+        # delta event naming the changed file and re-fetch only
+        # /graph?file_path=... instead of the whole graph.
+        payload = json.dumps({"type": "delta", "file_path": changed_path})
+        asyncio.run_coroutine_threadsafe(manager.broadcast(payload), loop)
 
     # Start watching current directory (or passed arg)
     # Ideally should be configurable. For now, "." (root of project)
@@ -60,46 +132,58 @@ app.add_middleware(
 
 
 @app.get("/graph")
-def get_graph(file_path: str | None = None):
+def get_graph(file_path: str | None = None, columnar: bool = False):
     """
     Return nodes and edges.
     If file_path is provided, filter nodes by that file (plus connected edges).
+    With columnar=true the payload is struct-of-arrays ({node_columns,
+    nodes, edge_columns, edges}) so column names aren't repeated per row;
+    the default stays the row-dict shape existing clients expect.
     """
+    stamp = _db_fingerprint()
+    cache_key = (file_path, columnar)
+    cached = _graph_cache.get(cache_key)
+    if cached is not None:
+        if stamp is not None and cached[0] == stamp:
+            return Response(content=cached[1], media_type="application/json")
+        del _graph_cache[cache_key]
+
+    node_columns = _NODE_COLUMNS
+    edge_columns = _EDGE_COLUMNS
+    node_rows: list = []
+    edge_rows: list = []
     with db._get_conn() as conn:
         if file_path:
-            # Get nodes in file
-            nodes_cursor = conn.execute("SELECT * FROM nodes WHERE file_path = ?", (file_path,))
-        else:
-            # Get all nodes
-            nodes_cursor = conn.execute("SELECT * FROM nodes")
-
-        nodes = [dict(row) for row in nodes_cursor.fetchall()]
-
-        # Determine edges to return
-        if not nodes:
-            return {"nodes": [], "edges": []}
-
-        if file_path:
-            # Only return edges connected to these nodes (simple) or all edges?
-            # Let's return all edges for now to be safe, or filter:
-            # Since edges table uses IDs, and we have node IDs...
-            node_ids = tuple(n["id"] for n in nodes)
-            if node_ids:
-                placeholders = ",".join("?" for _ in node_ids)
-                # Edges causing these nodes (incoming) OR caused by these nodes (outgoing)
-                query = (
-                    "SELECT * FROM edges WHERE from_node_id IN "
-                    f"({placeholders}) OR to_node_id IN ({placeholders})"
-                )
-                edges_cursor = conn.execute(query, node_ids + node_ids)
-                edges = [dict(row) for row in edges_cursor.fetchall()]
-            else:
-                edges = []
+            # One tagged stream holds the file's nodes and their edges
+            for row in conn.execute(_GRAPH_FOR_FILE_QUERY, (file_path,)):
+                if row[0] == "n":
+                    node_rows.append(tuple(row)[1:])
+                else:
+                    edge_rows.append(tuple(row)[1:5])
         else:
-            edges_cursor = conn.execute("SELECT * FROM edges")
-            edges = [dict(row) for row in edges_cursor.fetchall()]
-
-    return {"nodes": nodes, "edges": edges}
+            node_rows = conn.execute(f"SELECT {', '.join(_NODE_COLUMNS)} FROM nodes").fetchall()
+            if node_rows:
+                edge_rows = conn.execute(f"SELECT {', '.join(_EDGE_COLUMNS)} FROM edges").fetchall()
+
+    if columnar:
+        payload = {
+            "node_columns": node_columns,
+            "nodes": [list(row) for row in node_rows],
+            "edge_columns": edge_columns,
+            "edges": [list(row) for row in edge_rows],
+        }
+    else:
+        payload = {
+            "nodes": [dict(zip(node_columns, row, strict=True)) for row in node_rows],
+            "edges": [dict(zip(edge_columns, row, strict=True)) for row in edge_rows],
+        }
+
+    # Rows are already plain JSON types, so dump directly — returning a dict
+    # would send the whole payload through FastAPI's jsonable_encoder walk.
+    body = json.dumps(payload, separators=(",", ":"))
+    if stamp is not None:
+        _graph_cache[cache_key] = (stamp, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.websocket("/ws")
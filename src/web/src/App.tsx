@@ -519,6 +519,36 @@ export default function App() {
     applyLayoutAndFilters();
   }, [applyLayoutAndFilters]);
 
+  // Patch only the changed file into the raw graph instead of re-fetching
+  // everything: swap that file's nodes, drop edges touching them, and merge
+  // in the fresh slice. Falls back to a full refresh if the delta fails.
+  const fetchDelta = async (filePath: string) => {
+    try {
+      const res = await axios.get(`${API_URL}/graph`, { params: { file_path: filePath } });
+      if (!res.data?.nodes) return;
+      const fileNodes: any[] = res.data.nodes;
+      const fileEdges: any[] = res.data.edges;
+      const fileNodeIds = new Set(fileNodes.map((n) => n.id));
+      const fileEdgeIds = new Set(fileEdges.map((e) => e.id));
+      const keptNodes = rawData.current.nodes.filter((n) => n.file_path !== filePath);
+      const keptEdges = rawData.current.edges.filter(
+        (e) =>
+          !fileEdgeIds.has(e.id) &&
+          !fileNodeIds.has(e.from_node_id) &&
+          !fileNodeIds.has(e.to_node_id)
+      );
+      rawData.current = {
+        nodes: [...keptNodes, ...fileNodes],
+        edges: [...keptEdges, ...fileEdges],
+      };
+      setLastUpdate(new Date().toLocaleTimeString());
+      await applyLayoutAndFilters();
+    } catch (err) {
+      console.error("Delta fetch failed, doing full refresh", err);
+      fetchGraph();
+    }
+  };
+
   useEffect(() => {
     fetchGraph();
 
@@ -528,6 +558,15 @@ export default function App() {
       ws.current.onmessage = (event) => {
         if (event.data === "refresh") {
           fetchGraph();
+          return;
+        }
+        try {
+          const msg = JSON.parse(event.data);
+          if (msg.type === "delta" && msg.file_path) {
+            fetchDelta(msg.file_path);
+          }
+        } catch {
+          // Unrecognized message; ignore.
         }
       };
       ws.current.onclose = () => {
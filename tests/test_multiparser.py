@@ -1,3 +1,5 @@
+import pytest
+
 from vibegraph.indexer.parser import (
     GenericParser,
     GoParser,
@@ -6,13 +8,15 @@ from vibegraph.indexer.parser import (
     TypeScriptParser,
 )
 
+# Sample sources shared by the tests below, hoisted so the literals are
+# built once at import and the parametrized cases can reference them by name.
+JS_BAD = b"function broken( return 123"
+TS_BAD = b"interface Broken { name string }"
+GO_BAD = b"func broken( return 123"
+RS_BAD = b"fn broken( -> i32 { 123 }"
+JAVA_BAD = b"public class Broken { void method( }"
 
-class TestJavaScriptParser:
-    """Test JavaScript/JSX parser"""
-
-    def test_extract_functions_and_classes(self):
-        parser = JavaScriptParser()
-        code = b"""
+JS_CLASS_SAMPLE = b"""
 class Calculator {
     add(a, b) {
         return a + b;
@@ -25,34 +29,8 @@ function multiply(x, y) {
 
 const divide = (a, b) => a / b;
 """
-        nodes, edges = parser.extract("test.js", code)
-
-        # Should extract: Calculator class, add method, multiply function, divide arrow function
-        assert len(nodes) >= 3
-        assert any(n.name == "Calculator" and n.kind == "class" for n in nodes)
-        assert any(n.name == "add" and n.kind == "function" for n in nodes)
-        assert any(n.name == "multiply" and n.kind == "function" for n in nodes)
-
-        # Should have edges (class defines method)
-        assert len(edges) >= 1
-
-    def test_handles_syntax_error(self):
-        """Parser should not crash on malformed code"""
-        parser = JavaScriptParser()
-        bad_code = b"function broken( return 123"
-
-        # Should return empty lists instead of crashing
-        nodes, edges = parser.extract("bad.js", bad_code)
-        assert isinstance(nodes, list)
-        assert isinstance(edges, list)
-
 
-class TestTypeScriptParser:
-    """Test TypeScript/TSX parser"""
-
-    def test_extract_interfaces_and_classes(self):
-        parser = TypeScriptParser()
-        code = b"""
+TS_INTERFACE_SAMPLE = b"""
 interface User {
     name: string;
     age: number;
@@ -68,30 +46,8 @@ function processUser(user: User): void {
     console.log(user.name);
 }
 """
-        nodes, _ = parser.extract("test.ts", code)
-
-        # Should extract: User interface, UserService class, getUser method, processUser function
-        assert len(nodes) >= 3
-        assert any(n.name == "User" and n.kind == "interface" for n in nodes)
-        assert any(n.name == "UserService" and n.kind == "class" for n in nodes)
-        assert any(n.name == "processUser" and n.kind == "function" for n in nodes)
-
-    def test_handles_syntax_error(self):
-        """Parser should not crash on malformed TypeScript"""
-        parser = TypeScriptParser()
-        bad_code = b"interface Broken { name string }"  # Missing colon
-
-        nodes, edges = parser.extract("bad.ts", bad_code)
-        assert isinstance(nodes, list)
-        assert isinstance(edges, list)
 
-
-class TestGoParser:
-    """Test Go parser"""
-
-    def test_extract_structs_and_functions(self):
-        parser = GoParser()
-        code = b"""
+GO_STRUCT_SAMPLE = b"""
 package main
 
 type Person struct {
@@ -107,29 +63,8 @@ func main() {
     println("Hello, World!")
 }
 """
-        nodes, _ = parser.extract("test.go", code)
-
-        # Should extract: Greet method, main function
-        assert len(nodes) >= 2
-        assert any(n.name == "Greet" for n in nodes)
-        assert any(n.name == "main" for n in nodes)
-
-    def test_handles_syntax_error(self):
-        """Parser should not crash on malformed Go code"""
-        parser = GoParser()
-        bad_code = b"func broken( return 123"
-
-        nodes, edges = parser.extract("bad.go", bad_code)
-        assert isinstance(nodes, list)
-        assert isinstance(edges, list)
 
-
-class TestRustParser:
-    """Test Rust parser"""
-
-    def test_extract_structs_and_traits(self):
-        parser = RustParser()
-        code = b"""
+RS_STRUCT_SAMPLE = b"""
 struct Point {
     x: i32,
     y: i32,
@@ -151,29 +86,8 @@ fn distance(p1: &Point, p2: &Point) -> f64 {
     (dx * dx + dy * dy).sqrt()
 }
 """
-        nodes, _ = parser.extract("test.rs", code)
-
-        # Should extract: Point struct, Drawable trait, new function, distance function
-        assert len(nodes) >= 3
-        assert any(n.name == "Point" and n.kind == "struct" for n in nodes)
-        assert any(n.name == "distance" for n in nodes)
-
-    def test_handles_syntax_error(self):
-        """Parser should not crash on malformed Rust code"""
-        parser = RustParser()
-        bad_code = b"fn broken( -> i32 { 123 }"
-
-        nodes, edges = parser.extract("bad.rs", bad_code)
-        assert isinstance(nodes, list)
-        assert isinstance(edges, list)
 
-
-class TestGenericParser:
-    """Test generic parser for C-family languages"""
-
-    def test_java_extraction(self):
-        parser = GenericParser("java")
-        code = b"""
+JAVA_SAMPLE = b"""
 public class HelloWorld {
     public static void main(String[] args) {
         System.out.println("Hello, World!");
@@ -184,15 +98,8 @@ public class HelloWorld {
     }
 }
 """
-        nodes, _ = parser.extract("test.java", code)
-
-        # Should extract at least the class and methods
-        assert len(nodes) > 0
-        assert any(n.kind in ["class", "function"] for n in nodes)
 
-    def test_cpp_extraction(self):
-        parser = GenericParser("cpp")
-        code = b"""
+CPP_SAMPLE = b"""
 class Vector3 {
 public:
     float x, y, z;
@@ -208,47 +115,166 @@ int main() {
     return 0;
 }
 """
+
+JS_COMMENTS_SAMPLE = b"""
+// This is a comment
+/* This is a multi-line
+   comment */
+"""
+
+
+class TestJavaScriptParser:
+    """Test JavaScript/JSX parser"""
+
+    @classmethod
+    def setup_class(cls):
+        # Constructing a parser loads the compiled grammar; do it once per
+        # class instead of per test.
+        cls.parser = JavaScriptParser()
+
+    def test_extract_functions_and_classes(self):
+        parser = self.parser
+        code = JS_CLASS_SAMPLE
+        nodes, edges = parser.extract("test.js", code)
+
+        # Should extract: Calculator class, add method, multiply function, divide arrow function
+        assert len(nodes) >= 3
+        assert any(n.name == "Calculator" and n.kind == "class" for n in nodes)
+        assert any(n.name == "add" and n.kind == "function" for n in nodes)
+        assert any(n.name == "multiply" and n.kind == "function" for n in nodes)
+
+        # Should have edges (class defines method)
+        assert len(edges) >= 1
+
+
+class TestTypeScriptParser:
+    """Test TypeScript/TSX parser"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.parser = TypeScriptParser()
+
+    def test_extract_interfaces_and_classes(self):
+        parser = self.parser
+        code = TS_INTERFACE_SAMPLE
+        nodes, _ = parser.extract("test.ts", code)
+
+        # Should extract: User interface, UserService class, getUser method, processUser function
+        assert len(nodes) >= 3
+        assert any(n.name == "User" and n.kind == "interface" for n in nodes)
+        assert any(n.name == "UserService" and n.kind == "class" for n in nodes)
+        assert any(n.name == "processUser" and n.kind == "function" for n in nodes)
+
+
+class TestGoParser:
+    """Test Go parser"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.parser = GoParser()
+
+    def test_extract_structs_and_functions(self):
+        parser = self.parser
+        code = GO_STRUCT_SAMPLE
+        nodes, _ = parser.extract("test.go", code)
+
+        # Should extract: Greet method, main function
+        assert len(nodes) >= 2
+        assert any(n.name == "Greet" for n in nodes)
+        assert any(n.name == "main" for n in nodes)
+
+
+class TestRustParser:
+    """Test Rust parser"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.parser = RustParser()
+
+    def test_extract_structs_and_traits(self):
+        parser = self.parser
+        code = RS_STRUCT_SAMPLE
+        nodes, _ = parser.extract("test.rs", code)
+
+        # Should extract: Point struct, Drawable trait, new function, distance function
+        assert len(nodes) >= 3
+        assert any(n.name == "Point" and n.kind == "struct" for n in nodes)
+        assert any(n.name == "distance" for n in nodes)
+
+
+class TestGenericParser:
+    """Test generic parser for C-family languages"""
+
+    @classmethod
+    def setup_class(cls):
+        cls.java_parser = GenericParser("java")
+        cls.cpp_parser = GenericParser("cpp")
+
+    def test_java_extraction(self):
+        parser = self.java_parser
+        code = JAVA_SAMPLE
+        nodes, _ = parser.extract("test.java", code)
+
+        # Should extract at least the class and methods
+        assert len(nodes) > 0
+        assert any(n.kind in ["class", "function"] for n in nodes)
+
+    def test_cpp_extraction(self):
+        parser = self.cpp_parser
+        code = CPP_SAMPLE
         nodes, _ = parser.extract("test.cpp", code)
 
         # Should extract class and functions
         assert len(nodes) > 0
         assert any(n.kind in ["class", "function"] for n in nodes)
 
-    def test_handles_syntax_error(self):
-        """Parser should not crash on malformed code"""
-        parser = GenericParser("java")
-        bad_code = b"public class Broken { void method( }"
 
-        nodes, edges = parser.extract("bad.java", bad_code)
-        assert isinstance(nodes, list)
-        assert isinstance(edges, list)
+# Every parser shares the same malformed-input contract, so one parametrized
+# test covers them all; supporting a new parser is a one-tuple addition.
+@pytest.mark.parametrize(
+    ("factory", "filename", "bad_code"),
+    [
+        (JavaScriptParser, "bad.js", JS_BAD),
+        (TypeScriptParser, "bad.ts", TS_BAD),
+        (GoParser, "bad.go", GO_BAD),
+        (RustParser, "bad.rs", RS_BAD),
+        (lambda: GenericParser("java"), "bad.java", JAVA_BAD),
+    ],
+    ids=["javascript", "typescript", "go", "rust", "generic-java"],
+)
+def test_parser_handles_syntax_error(factory, filename, bad_code):
+    """Parsers should return lists, not crash, on malformed code."""
+    nodes, edges = factory().extract(filename, bad_code)
+    assert isinstance(nodes, list)
+    assert isinstance(edges, list)
 
 
 class TestEdgeCases:
     """Test edge cases across all parsers"""
 
+    @classmethod
+    def setup_class(cls):
+        cls.js_parser = JavaScriptParser()
+        cls.ts_parser = TypeScriptParser()
+
     def test_empty_file(self):
         """Empty files should return empty lists"""
-        parser = JavaScriptParser()
+        parser = self.js_parser
         nodes, edges = parser.extract("empty.js", b"")
         assert nodes == []
         assert edges == []
 
     def test_whitespace_only(self):
         """Files with only whitespace should return empty lists"""
-        parser = TypeScriptParser()
+        parser = self.ts_parser
         nodes, edges = parser.extract("whitespace.ts", b"   \n\n  \t  \n")
         assert nodes == []
         assert edges == []
 
     def test_comments_only(self):
         """Files with only comments might not extract nodes"""
-        parser = JavaScriptParser()
-        code = b"""
-// This is a comment
-/* This is a multi-line
-   comment */
-"""
+        parser = self.js_parser
+        code = JS_COMMENTS_SAMPLE
         nodes, edges = parser.extract("comments.js", code)
         # Should not crash, may return empty
         assert isinstance(nodes, list)
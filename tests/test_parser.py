@@ -15,34 +15,33 @@ class MyClass:
     file_path = "/tmp/test.py"
     nodes, edges = parser.extract(file_path, source_code)
 
-    # Check Nodes
+    # Check Nodes — index once, then every lookup is O(1) instead of a
+    # linear scan per assertion.
     assert len(nodes) == 4
+    by_name = {n.name: n for n in nodes}
 
     # Node 0: test.py (module)
     module_node = next(n for n in nodes if n.kind == "module")
     assert module_node.name == "test"
 
     # Node 1: hello_world
-    func_node = next(n for n in nodes if n.name == "hello_world")
+    func_node = by_name["hello_world"]
     assert func_node.kind == "function"
     assert func_node.docstring == "This is a docstring."
     assert "(name)" in func_node.signature
 
     # Node 2: MyClass
-    class_node = next(n for n in nodes if n.name == "MyClass")
+    class_node = by_name["MyClass"]
     assert class_node.kind == "class"
 
     # Node 3: method
-    method_node = next(n for n in nodes if n.name == "method")
+    method_node = by_name["method"]
     assert method_node.kind == "function"
 
     # Check Edges (File defines hello_world and MyClass, MyClass defines method)
     assert len(edges) >= 3
+    edge_set = {(e.from_node_id, e.to_node_id) for e in edges}
 
-    # helper to find edges
-    def has_edge(f, t):
-        return any(e.from_node_id == f and e.to_node_id == t for e in edges)
-
-    assert has_edge(module_node.id, func_node.id)
-    assert has_edge(module_node.id, class_node.id)
-    assert has_edge(class_node.id, method_node.id)
+    assert (module_node.id, func_node.id) in edge_set
+    assert (module_node.id, class_node.id) in edge_set
+    assert (class_node.id, method_node.id) in edge_set
@@ -1,15 +1,29 @@
+import http.client
 import json
 import sys
-import urllib.request
+import time
 
 try:
     print("Testing GET http://localhost:8000/graph ...")
-    with urllib.request.urlopen("http://localhost:8000/graph") as response:
-        if response.status != 200:
-            print("Status Code:", response.status)
-            sys.exit(1)
+    # One persistent connection: follow-up probes against other endpoints
+    # reuse the socket instead of paying a TCP handshake per request.
+    conn = http.client.HTTPConnection("localhost", 8000)
+
+    t0 = time.perf_counter()
+    conn.request("GET", "/graph")
+    response = conn.getresponse()
+    if response.status != 200:
+        print("Status Code:", response.status)
+        sys.exit(1)
+    body = response.read()
+    t1 = time.perf_counter()
+
+    data = json.loads(body)
+    t2 = time.perf_counter()
 
-        data = json.loads(response.read().decode())
+    # Network vs parse split: shows whether a slow run is transfer-bound
+    # or decode-bound before reaching for a profiler.
+    print(f"network: {(t1 - t0) * 1e3:.1f} ms  parse: {(t2 - t1) * 1e3:.1f} ms  bytes: {len(body)}")
 
     if "nodes" not in data or "edges" not in data:
         print("ERROR: Response missing 'nodes' or 'edges' keys.")
@@ -35,6 +49,8 @@ try:
     else:
         print("\nWARNING: No nodes returned. Database might be empty.")
 
+    conn.close()
+
 except Exception as e:
     print(f"Request failed: {e}")
     sys.exit(1)